@@ -327,6 +327,7 @@ def _command_enrich(args: argparse.Namespace) -> None:
         all_metrics=bool(args.all_metrics),
         use_catalog_jsonl=not bool(getattr(args, "no_jsonl", False)),
         reuse_provider_jsonl=bool(getattr(args, "reuse_jsonl", False)),
+        validation_workers=args.validation_workers,
     )
 
 
@@ -492,7 +493,7 @@ def _command_validate(args: argparse.Namespace) -> None:
         )
         enriched = read_csv(enriched_csv)
 
-    report = generate_validation_report(enriched)
+    report = generate_validation_report(enriched, max_workers=args.validation_workers)
     write_csv(report, out)
     logging.info(f"✔ Validation report generated: {out}")
 
@@ -763,6 +764,14 @@ def main(argv: list[str] | None = None) -> None:
         type=Path,
         help="Output file for validation report (default: data/output/Validation_Report.csv)",
     )
+    p_enrich.add_argument(
+        "--validation-workers",
+        type=int,
+        help=(
+            "Worker processes for the validation report (0 = one per CPU; "
+            "default: serial unless configured in VALIDATION)"
+        ),
+    )
     p_enrich.add_argument(
         "--write-csv",
         action=argparse.BooleanOptionalAction,
@@ -878,6 +887,14 @@ def main(argv: list[str] | None = None) -> None:
         type=Path,
         help="Output validation report path (default: <output-dir>/Validation_Report.csv)",
     )
+    p_val.add_argument(
+        "--validation-workers",
+        type=int,
+        help=(
+            "Worker processes for the validation report (0 = one per CPU; "
+            "default: serial unless configured in VALIDATION)"
+        ),
+    )
     p_val.add_argument(
         "--log-file",
         type=Path,
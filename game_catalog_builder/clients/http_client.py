@@ -89,6 +89,7 @@ class HTTPJSONClient:
             on_fail_return=on_fail_return,
             context=context,
             retry_stats=self.stats,
+            ratelimiter=ratelimiter,
         )
         if data is on_fail_return:
             raise_on_new_network_failure(self.stats, before=before_net, context=context)
@@ -142,6 +143,7 @@ class HTTPJSONClient:
             on_fail_return=on_fail_return,
             context=context,
             retry_stats=self.stats,
+            ratelimiter=ratelimiter,
         )
         if resp is on_fail_return:
             raise_on_new_network_failure(self.stats, before=before_net, context=context)
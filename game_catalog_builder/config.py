@@ -9,6 +9,10 @@ class RetryConfig:
     base_sleep_s: float = 1.0
     jitter_s: float = 0.3
     http_429_default_retry_after_s: float = 5.0
+    # AIMD pacing for rate limiters passed to `with_retries`: overload responses double the
+    # request interval (capped), and each success shrinks it by a fixed step.
+    aimd_max_interval_s: float = 10.0
+    aimd_recover_step_s: float = 0.05
 
 
 @dataclass(frozen=True)
@@ -23,6 +27,11 @@ class MatchingConfig:
 class ValidationConfig:
     title_score_warn: int = 90
     year_max_diff: int = 1
+    # Opt-in: with parallel_workers != 1, reports of at least parallel_min_rows rows are split
+    # into row chunks scored in spawned worker processes (0 workers means os.cpu_count()).
+    # Serial by default until the pool is benchmarked on multi-core machines.
+    parallel_min_rows: int = 5000
+    parallel_workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -87,6 +96,10 @@ class CLIConfig:
     steam_flush_batch_size: int = 25
     steam_streaming_flush_batch_size: int = 10
     progress_every_n: int = 25
+    # Rows between intermediate provider CSV rewrites. Each checkpoint rewrites the whole file, so
+    # small values make enrichment O(N^2) in disk I/O; API results are cached, so a crash between
+    # checkpoints only costs cache hits on rerun. A final write always happens at the end.
+    checkpoint_every_n: int = 200
     progress_min_interval_s: float = 30.0
     max_parallel_providers: int = 8
 
@@ -5,6 +5,8 @@ import math
 import re
 from typing import Any
 
+_MULTI_WS_RE = re.compile(r"\s{2,}")
+
 
 def to_csv_cell(value: Any) -> str:
     """
@@ -16,6 +18,13 @@ def to_csv_cell(value: Any) -> str:
     - list/dict -> JSON string (so it round-trips without lossy comma joins)
     - everything else -> str(value)
     """
+    if isinstance(value, str):
+        # Strings are the bulk of every frame and `pd.isna` is always False for them.
+        if value.strip().casefold() == "nan":
+            return ""
+        # Avoid embedded newlines/tabs in CSV cells; keep JSONL as the lossless typed artifact.
+        s = value.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+        return _MULTI_WS_RE.sub(" ", s).strip()
     try:
         import pandas as pd
 
@@ -25,17 +34,10 @@ def to_csv_cell(value: Any) -> str:
         pass
     if isinstance(value, float) and math.isnan(value):
         return ""
-    if isinstance(value, str) and value.strip().casefold() == "nan":
-        return ""
     if value is None:
         return ""
     if isinstance(value, bool):
         return "YES" if value else ""
-    if isinstance(value, str):
-        # Avoid embedded newlines/tabs in CSV cells; keep JSONL as the lossless typed artifact.
-        s = value.replace("\r", " ").replace("\n", " ").replace("\t", " ")
-        s = re.sub(r"\s{2,}", " ", s).strip()
-        return s
     if isinstance(value, dict):
         return json.dumps(value, ensure_ascii=False)
     if isinstance(value, list):
@@ -48,21 +48,23 @@ def iter_named_rows_with_progress(
     *,
     label: str,
     total: int | None,
-    skip_row: Callable[[pd.Series], bool] | None = None,
-) -> Iterator[tuple[int, pd.Series, str, int]]:
+    skip_row: Callable[[dict[str, Any]], bool] | None = None,
+) -> Iterator[tuple[int, dict[str, Any], str, int]]:
     """
     Iterate rows with a non-empty Name while emitting periodic progress logs.
 
+    Rows are yielded as plain dicts (column -> value); building them in one
+    `to_dict("records")` pass avoids the per-row Series that `iterrows()` creates.
+    Rows whose index label is duplicated are skipped, since they cannot be addressed by
+    position unambiguously.
+
     Yields: (idx, row, name, seen_index)
     """
     progress = Progress(label, total=total or None, every_n=CLI.progress_every_n)
+    duplicated = df.index.duplicated(keep=False) if not df.index.is_unique else None
     seen = 0
-    for idx, row in df.iterrows():
-        try:
-            pos = df.index.get_loc(idx)
-        except Exception:
-            continue
-        if not isinstance(pos, int):
+    for pos, row in enumerate(df.to_dict("records")):
+        if duplicated is not None and duplicated[pos]:
             continue
         if skip_row is not None and skip_row(row):
             continue
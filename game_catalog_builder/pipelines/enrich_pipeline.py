@@ -4,10 +4,9 @@ import logging
 import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
 from pathlib import Path
 from queue import Empty, Queue
-from typing import TYPE_CHECKING, Mapping, cast
+from typing import TYPE_CHECKING, Any, Mapping, cast
 
 import pandas as pd
 
@@ -31,7 +30,7 @@ from ..utils import (
     is_row_processed,
     load_credentials,
     load_identity_overrides,
-    load_json_cache,
+    mask_rows_processed,
     normalize_game_name,
     read_csv,
 )
@@ -152,7 +151,7 @@ def process_steam_and_steamspy_streaming(
     steam_cache_path: Path,
     steamspy_cache_path: Path,
     registry: MetricsRegistry,
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     def _clean_str(value: object) -> str:
         # Pandas may store empty cells as NaN floats; avoid propagating "nan".
@@ -185,7 +184,15 @@ def process_steam_and_steamspy_streaming(
 
     def steam_producer() -> None:
         processed = 0
+        # `processed` only moves on cache hits and batch flushes, so checkpoint on rows processed
+        # since the last write rather than on `processed % n` (which would fire on every row while
+        # the counter sits still).
+        checkpointed = 0
         pending: dict[int, list[int]] = {}
+        steam_done = mask_rows_processed(df_steam, ["Steam_Name"])
+        steamspy_done = mask_rows_processed(df_steamspy, ["SteamSpy_Owners"])
+        # Catalogs repeat names across platforms/editions; resolve each name once per run.
+        searched: dict[str, dict[str, Any] | None] = {}
 
         def _flush_pending() -> None:
             nonlocal processed
@@ -220,9 +227,9 @@ def process_steam_and_steamspy_streaming(
                 clear_prefixed_columns(df_steam, int(idx), "Steam_")
                 continue
 
-            if is_row_processed(df_steam, int(idx), ["Steam_Name"]):
+            if steam_done[idx]:
                 current_appid = _clean_str(df_steam.at[idx, "Steam_AppID"])
-                if current_appid and not is_row_processed(df_steamspy, int(idx), ["SteamSpy_Owners"]):
+                if current_appid and not steamspy_done[idx]:
                     q.put((int(idx), name, current_appid))
                     steamspy_progress["enqueued"] += 1
                 if not (override_appid and current_appid != override_appid):
@@ -232,7 +239,9 @@ def process_steam_and_steamspy_streaming(
                 appid = override_appid
             else:
                 logging.debug(f"[STEAM] Processing: {name}")
-                search = steam_client.search_appid(name)
+                if name not in searched:
+                    searched[name] = steam_client.search_appid(name)
+                search = searched[name]
                 if not search:
                     continue
                 appid = _clean_str(search.get("id"))
@@ -261,12 +270,14 @@ def process_steam_and_steamspy_streaming(
             else:
                 pending.setdefault(appid_int, []).append(int(idx))
 
-            if processed % 10 == 0:
+            if processed - checkpointed >= CLI.checkpoint_every_n:
                 write_provider_output_csv(df_steam, steam_output_csv, prefix="Steam_")
+                checkpointed = processed
 
             if len(pending) >= CLI.steam_streaming_flush_batch_size:
                 _flush_pending()
                 write_provider_output_csv(df_steam, steam_output_csv, prefix="Steam_")
+                checkpointed = processed
 
         _flush_pending()
         write_provider_output_csv(df_steam, steam_output_csv, prefix="Steam_")
@@ -276,12 +287,15 @@ def process_steam_and_steamspy_streaming(
         processed = 0
         progress = Progress("STEAMSPY", total=None, every_n=CLI.progress_every_n)
         last_log = time.time()
+        # The consumer is the only writer of df_steamspy, so a mask computed once and updated
+        # after each write stays in sync with `is_row_processed`.
+        done_mask = mask_rows_processed(df_steamspy, ["SteamSpy_Owners"])
         while True:
             item = q.get()
             if item is None:
                 break
             idx, name, appid = item
-            if is_row_processed(df_steamspy, idx, ["SteamSpy_Owners"]):
+            if done_mask[idx]:
                 continue
             logging.debug(f"[STEAMSPY] {name} (AppID {appid})")
             try:
@@ -299,6 +313,7 @@ def process_steam_and_steamspy_streaming(
                 registry=registry,
                 label="STEAMSPY",
             )
+            done_mask[idx] = is_row_processed(df_steamspy, idx, ["SteamSpy_Owners"])
             processed += 1
             steamspy_progress["done"] += 1
             progress.maybe_log(processed)
@@ -314,7 +329,7 @@ def process_steam_and_steamspy_streaming(
                 total = f"{done}/{enq}" if enq else f"{done}"
                 qmsg = f" queue={qsize}" if qsize >= 0 else ""
                 logging.info(f"[STEAMSPY] Queue progress {total} tasks{qmsg}")
-            if processed % 10 == 0:
+            if processed % CLI.checkpoint_every_n == 0:
                 write_provider_output_csv(
                     df_steamspy,
                     steamspy_output_csv,
@@ -348,7 +363,7 @@ def process_igdb(
     required_cols: list[str],
     registry: MetricsRegistry,
     language: str = "en",
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
 ) -> pd.DataFrame:
     client = IGDBClient(
         client_id=credentials.get("igdb", {}).get("client_id", ""),
@@ -359,9 +374,13 @@ def process_igdb(
     )
     df = load_or_merge_dataframe(input_csv, output_csv)
     total_rows = total_named_rows(df)
+    done = mask_rows_processed(df, required_cols)
 
     processed = 0
+    # Rows are mostly counted by batch flushes; see the Steam producer for why this is tracked.
+    checkpointed = 0
     pending_by_id: dict[object, list[int]] = {}
+    searched: dict[str, dict[str, Any] | None] = {}
 
     def _apply_igdb_fields(_igdb_id: object, indices: list[int], data: object) -> int:
         if not isinstance(data, dict):
@@ -388,7 +407,7 @@ def process_igdb(
             clear_prefixed_columns(df, int(idx), "IGDB_")
             continue
 
-        if is_row_processed(df, idx, required_cols):
+        if done[idx]:
             if not (override_id and str(df.at[idx, "IGDB_ID"] or "").strip() != override_id):
                 continue
 
@@ -401,19 +420,22 @@ def process_igdb(
                 pending_by_id.setdefault(igdb_id, []).append(int(idx))
             else:
                 logging.debug(f"[IGDB] Processing: {name}")
-                data = client.search(name)
+                if name not in searched:
+                    searched[name] = client.search(name)
+                data = searched[name]
                 if not data:
                     continue
                     apply_registered_metrics(df, idx=idx, metrics=data, registry=registry, label="IGDB")
                     processed += 1
 
-        if processed % 10 == 0:
+        if processed - checkpointed >= CLI.checkpoint_every_n:
             write_provider_output_csv(
                 df,
                 output_csv,
                 prefix="IGDB_",
                 extra=("IGDB_Score_100", "IGDB_CriticScore_100"),
             )
+            checkpointed = processed
 
         if len(pending_by_id) >= CLI.igdb_flush_batch_size:
             _flush_pending()
@@ -423,6 +445,7 @@ def process_igdb(
                 prefix="IGDB_",
                 extra=("IGDB_Score_100", "IGDB_CriticScore_100"),
             )
+            checkpointed = processed
 
     _flush_pending()
     write_provider_output_csv(
@@ -445,7 +468,7 @@ def process_rawg(
     required_cols: list[str],
     registry: MetricsRegistry,
     language: str = "en",
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
     row_filter: set[str] | None = None,
 ) -> pd.DataFrame:
     client = RAWGClient(
@@ -460,8 +483,10 @@ def process_rawg(
 
         df = filter_rows_by_ids(df, row_filter)
     total_rows = total_named_rows(df)
+    done = mask_rows_processed(df, required_cols)
 
     processed = 0
+    searched: dict[str, dict[str, Any] | None] = {}
     for idx, row, name, _seen in iter_named_rows_with_progress(df, label="RAWG", total=total_rows):
         rowid = str(row.get("RowId", "") or "").strip()
         override_id = ""
@@ -472,7 +497,7 @@ def process_rawg(
             clear_prefixed_columns(df, int(idx), "RAWG_")
             continue
 
-        if is_row_processed(df, idx, required_cols):
+        if done[idx]:
             if not (override_id and str(df.at[idx, "RAWG_ID"] or "").strip() != override_id):
                 continue
 
@@ -483,7 +508,9 @@ def process_rawg(
                 continue
         else:
             logging.debug(f"[RAWG] Processing: {name}")
-            result = client.search(name)
+            if name not in searched:
+                searched[name] = client.search(name)
+            result = searched[name]
             if not result:
                 continue
 
@@ -496,7 +523,7 @@ def process_rawg(
         )
 
         processed += 1
-        if output_csv and processed % 10 == 0:
+        if output_csv and processed % CLI.checkpoint_every_n == 0:
             write_provider_output_csv(df, output_csv, prefix="RAWG_", extra=("RAWG_Score_100",))
 
     if output_csv:
@@ -513,7 +540,7 @@ def process_steam(
     cache_path: Path,
     required_cols: list[str],
     registry: MetricsRegistry,
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
     row_filter: set[str] | None = None,
 ) -> pd.DataFrame:
     client = SteamClient(cache_path=cache_path, min_interval_s=STEAM.storesearch_min_interval_s)
@@ -523,8 +550,10 @@ def process_steam(
 
         df = filter_rows_by_ids(df, row_filter)
     total_rows = total_named_rows(df)
+    done = mask_rows_processed(df, required_cols)
 
     pending: dict[object, list[int]] = {}
+    searched: dict[str, dict[str, Any] | None] = {}
 
     def _apply_steam_fields(appid: object, indices: list[int], details: object) -> int:
         if not isinstance(details, dict):
@@ -560,14 +589,16 @@ def process_steam(
             clear_prefixed_columns(df, int(idx), "Steam_")
             continue
 
-        if is_row_processed(df, idx, required_cols):
+        if done[idx]:
             if not (override_appid and str(df.at[idx, "Steam_AppID"] or "").strip() != override_appid):
                 continue
 
         appid_str = override_appid or str(row.get("Steam_AppID", "") or "").strip()
         if not appid_str:
             logging.debug(f"[STEAM] Processing: {name}")
-            search = client.search_appid(name)
+            if name not in searched:
+                searched[name] = client.search_appid(name)
+            search = searched[name]
             if not search or not search.get("id"):
                 continue
             appid_str = str(search.get("id") or "").strip()
@@ -580,7 +611,7 @@ def process_steam(
         pending.setdefault(appid, []).append(int(idx))
         queued += 1
 
-        if output_csv and queued % 10 == 0:
+        if output_csv and queued % CLI.checkpoint_every_n == 0:
             write_provider_output_csv(df, output_csv, prefix="Steam_")
 
         if len(pending) >= CLI.steam_flush_batch_size:
@@ -615,6 +646,7 @@ def process_steamspy(
         df = filter_rows_by_ids(df, row_filter)
     appids = df["Steam_AppID"] if "Steam_AppID" in df.columns else pd.Series([], dtype=str)
     total_rows = int((appids.astype(str).str.strip() != "").sum())
+    done = mask_rows_processed(df, required_cols)
 
     processed = 0
     for idx, row, name, _ in iter_named_rows_with_progress(
@@ -624,7 +656,7 @@ def process_steamspy(
         skip_row=lambda r: not str(r.get("Steam_AppID", "") or "").strip(),
     ):
         appid = str(row.get("Steam_AppID", "") or "").strip()
-        if is_row_processed(df, idx, required_cols):
+        if done[idx]:
             continue
         logging.debug(f"[STEAMSPY] {name} (AppID {appid})")
         data = client.fetch(int(appid))
@@ -633,7 +665,7 @@ def process_steamspy(
             continue
         apply_registered_metrics(df, idx=idx, metrics=data, registry=registry, label="STEAMSPY")
         processed += 1
-        if output_csv and processed % 10 == 0:
+        if output_csv and processed % CLI.checkpoint_every_n == 0:
             write_provider_output_csv(df, output_csv, prefix="SteamSpy_", extra=("SteamSpy_Score_100",))
 
     if output_csv:
@@ -650,7 +682,7 @@ def process_hltb(
     cache_path: Path,
     required_cols: list[str],
     registry: MetricsRegistry,
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
     row_filter: set[str] | None = None,
 ) -> pd.DataFrame:
     def _clean_str(value: object) -> str:
@@ -671,8 +703,10 @@ def process_hltb(
 
         df = filter_rows_by_ids(df, row_filter)
     total_rows = total_named_rows(df)
+    done = mask_rows_processed(df, required_cols)
 
     processed = 0
+    searched: dict[tuple[str, str, str], dict[str, Any] | None] = {}
     for idx, row, name, _seen in iter_named_rows_with_progress(df, label="HLTB", total=total_rows):
         rowid = _clean_str(row.get("RowId", ""))
         pinned_id = _clean_str(row.get("HLTB_ID", ""))
@@ -685,19 +719,22 @@ def process_hltb(
             continue
         query = query or name
 
-        if is_row_processed(df, idx, required_cols):
+        if done[idx]:
             prev_name = str(df.at[idx, "HLTB_Name"] or "").strip()
             if prev_name and normalize_game_name(prev_name) == normalize_game_name(query):
                 continue
 
         logging.debug(f"[HLTB] Processing: {query}")
-        data = client.search(name, query=query, hltb_id=pinned_id or None)
+        key = (name, query, pinned_id)
+        if key not in searched:
+            searched[key] = client.search(name, query=query, hltb_id=pinned_id or None)
+        data = searched[key]
         if not data:
             continue
         apply_registered_metrics(df, idx=idx, metrics=data, registry=registry, label="HLTB")
 
         processed += 1
-        if output_csv and processed % 10 == 0:
+        if output_csv and processed % CLI.checkpoint_every_n == 0:
             write_provider_output_csv(df, output_csv, prefix="HLTB_", extra=("HLTB_Score_100",))
 
     if output_csv:
@@ -714,7 +751,7 @@ def process_wikidata(
     cache_path: Path,
     required_cols: list[str],
     registry: MetricsRegistry,
-    identity_overrides: dict[str, dict[str, str]] | None = None,
+    identity_overrides: Mapping[str, dict[str, str]] | None = None,
     row_filter: set[str] | None = None,
 ) -> pd.DataFrame:
     client = WikidataClient(cache_path=cache_path, min_interval_s=WIKIDATA.min_interval_s)
@@ -724,104 +761,19 @@ def process_wikidata(
     summary_client = WikipediaSummaryClient(
         cache_path=cache_path.parent / "wiki_summary_cache.json", min_interval_s=0.15
     )
-    cache_dir = cache_path.parent
-    steam_cache = load_json_cache(cache_dir / "steam_cache.json")
-    rawg_cache = load_json_cache(cache_dir / "rawg_cache.json")
-    igdb_cache = load_json_cache(cache_dir / "igdb_cache.json")
-    steam_by_id = steam_cache.get("by_id") if isinstance(steam_cache, dict) else {}
-    rawg_by_id = rawg_cache.get("by_id") if isinstance(rawg_cache, dict) else {}
-    igdb_by_id = igdb_cache.get("by_id") if isinstance(igdb_cache, dict) else {}
-
     df = load_or_merge_dataframe(input_csv, output_csv) if output_csv else read_csv(input_csv)
     if row_filter:
         from .common import filter_rows_by_ids
 
         df = filter_rows_by_ids(df, row_filter)
     total_rows = total_named_rows(df)
+    done = mask_rows_processed(df, required_cols)
 
     processed = 0
+    # Rows are counted by batch flushes; see the Steam producer for why this is tracked.
+    checkpointed = 0
     pending_by_id: dict[object, list[int]] = {}
 
-    def _year_hint(row: pd.Series) -> int | None:
-        yh = str(row.get("YearHint", "") or "").strip()
-        if yh.isdigit() and len(yh) == 4:
-            y = int(yh)
-            if 1900 <= y <= 2100:
-                return y
-        return None
-
-    def _derived_year_hint(row: pd.Series) -> int | None:
-        yh = _year_hint(row)
-        if yh is not None:
-            return yh
-
-        rawg_id = str(row.get("RAWG_ID", "") or "").strip()
-        if rawg_id and isinstance(rawg_by_id, dict):
-            obj = rawg_by_id.get(f"en:{rawg_id}") or rawg_by_id.get(str(rawg_id))
-            if isinstance(obj, dict):
-                released = str(obj.get("released") or "").strip()
-                if len(released) >= 4 and released[:4].isdigit():
-                    return int(released[:4])
-
-        igdb_id = str(row.get("IGDB_ID", "") or "").strip()
-        if igdb_id and isinstance(igdb_by_id, dict):
-            obj = igdb_by_id.get(f"en:{igdb_id}") or igdb_by_id.get(str(igdb_id))
-            if isinstance(obj, dict):
-                ts = obj.get("first_release_date")
-                if isinstance(ts, (int, float)) and ts > 0:
-                    try:
-                        return int(datetime.fromtimestamp(float(ts)).year)
-                    except Exception:
-                        pass
-
-        appid = str(row.get("Steam_AppID", "") or "").strip()
-        if appid and isinstance(steam_by_id, dict):
-            obj = steam_by_id.get(appid)
-            if isinstance(obj, dict):
-                date_s = str((obj.get("release_date") or {}).get("date") or "").strip()
-                import re
-
-                m = re.search(r"\b(19\d{2}|20\d{2})\b", date_s)
-                if m:
-                    return int(m.group(1))
-        return None
-
-    def _fallback_titles(row: pd.Series) -> list[str]:
-        titles: list[str] = []
-        appid = str(row.get("Steam_AppID", "") or "").strip()
-        if appid and isinstance(steam_by_id, dict):
-            obj = steam_by_id.get(appid)
-            if isinstance(obj, dict):
-                t = str(obj.get("name") or "").strip()
-                if t:
-                    titles.append(t)
-
-        rawg_id = str(row.get("RAWG_ID", "") or "").strip()
-        if rawg_id and isinstance(rawg_by_id, dict):
-            obj = rawg_by_id.get(f"en:{rawg_id}") or rawg_by_id.get(str(rawg_id))
-            if isinstance(obj, dict):
-                t = str(obj.get("name") or "").strip()
-                if t:
-                    titles.append(t)
-
-        igdb_id = str(row.get("IGDB_ID", "") or "").strip()
-        if igdb_id and isinstance(igdb_by_id, dict):
-            obj = igdb_by_id.get(f"en:{igdb_id}") or igdb_by_id.get(str(igdb_id))
-            if isinstance(obj, dict):
-                t = str(obj.get("name") or "").strip()
-                if t:
-                    titles.append(t)
-
-        out: list[str] = []
-        seen_set: set[str] = set()
-        for t in titles:
-            key = t.casefold()
-            if key in seen_set:
-                continue
-            seen_set.add(key)
-            out.append(t)
-        return out
-
     wiki_tasks: Queue[tuple[str, str, list[int]] | None] = Queue()
     wiki_results: Queue[tuple[list[int], dict[str, object]]] = Queue()
     wiki_progress = {"enqueued": 0, "done": 0}
@@ -944,7 +896,7 @@ def process_wikidata(
                 clear_prefixed_columns(df, int(idx), "Wikidata_")
                 continue
 
-            if is_row_processed(df, idx, required_cols):
+            if done[idx]:
                 if not (override_qid and str(df.at[idx, "Wikidata_QID"] or "").strip() != override_qid):
                     enwiki_title = str(df.at[idx, "Wikidata_EnwikiTitle"] or "").strip()
                     if enwiki_title:
@@ -969,12 +921,16 @@ def process_wikidata(
 
             if seen % CLI.progress_every_n == 0:
                 _drain_wiki_results()
+
+            if processed - checkpointed >= CLI.checkpoint_every_n:
                 write_provider_output_csv(df, output_csv, prefix="Wikidata_")
+                checkpointed = processed
 
             if len(pending_by_id) >= WIKIDATA.get_by_ids_batch_size:
                 _flush_pending()
                 _drain_wiki_results()
                 write_provider_output_csv(df, output_csv, prefix="Wikidata_")
+                checkpointed = processed
 
         _flush_pending()
         wiki_tasks.put(None)
@@ -1011,6 +967,7 @@ def run_enrich(
     all_metrics: bool = False,
     use_catalog_jsonl: bool = True,
     reuse_provider_jsonl: bool = False,
+    validation_workers: int | None = None,
 ) -> None:
     from .context import PipelineContext
 
@@ -1030,6 +987,7 @@ def run_enrich(
         all_metrics=all_metrics,
         use_catalog_jsonl=use_catalog_jsonl,
         reuse_provider_jsonl=reuse_provider_jsonl,
+        validation_workers=validation_workers,
     )
 
 
@@ -1049,6 +1007,7 @@ def run_enrich_ctx(
     all_metrics: bool = False,
     use_catalog_jsonl: bool = True,
     reuse_provider_jsonl: bool = False,
+    validation_workers: int | None = None,
 ) -> None:
     if not input_csv.exists():
         raise SystemExit(f"Input file not found: {input_csv}")
@@ -1408,7 +1367,11 @@ def run_enrich_ctx(
         if _has_any("Wikidata_QID"):
             enabled_for_validation.add("wikidata")
 
-        report = generate_validation_report(merged, enabled_providers=enabled_for_validation)
+        report = generate_validation_report(
+            merged,
+            enabled_providers=enabled_for_validation,
+            max_workers=validation_workers,
+        )
         write_full_csv(report, validate_out)
         logging.info(f"✔ Validation report generated: {validate_out}")
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, cast
+from typing import Any, Callable, Mapping, cast
 
 import pandas as pd
 
@@ -138,9 +138,9 @@ def _is_yes(v: object) -> bool:
     return str(v or "").strip().upper() in {"YES", "Y", "TRUE", "1"}
 
 
-def _year_hint_from_row(row: pd.Series) -> int | None:
+def _year_hint_from_row(row: Mapping[str, Any]) -> int | None:
     for col in ("YearHint", "Year", "ReleaseYear", "Release_Year"):
-        if col not in row.index:
+        if col not in row:
             continue
         v = str(row.get(col, "") or "").strip()
         if v.isdigit() and len(v) == 4:
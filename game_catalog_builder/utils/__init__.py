@@ -13,16 +13,19 @@ if TYPE_CHECKING:  # pragma: no cover
     from .review import ReviewConfig, build_review_csv
     from .utilities import (
         IDENTITY_NOT_FOUND,
+        IdentityTable,
         ProjectPaths,
         RunPaths,
         ensure_columns,
         ensure_row_ids,
         extract_year_hint,
         fuzzy_score,
+        fuzzy_scores_pairwise,
         is_row_processed,
         load_credentials,
         load_identity_overrides,
         load_json_cache,
+        mask_rows_processed,
         normalize_game_name,
         pick_best_match,
         read_csv,
@@ -34,12 +37,15 @@ __all__ = [
     "ProjectPaths",
     "RunPaths",
     "IDENTITY_NOT_FOUND",
+    "IdentityTable",
     "extract_year_hint",
     "ensure_columns",
     "ensure_row_ids",
     "load_identity_overrides",
     "fuzzy_score",
+    "fuzzy_scores_pairwise",
     "is_row_processed",
+    "mask_rows_processed",
     "load_credentials",
     "load_json_cache",
     "generate_validation_report",
@@ -56,16 +62,19 @@ __all__ = [
 def __getattr__(name: str) -> Any:  # pragma: no cover
     if name in {
         "IDENTITY_NOT_FOUND",
+        "IdentityTable",
         "ProjectPaths",
         "RunPaths",
         "ensure_columns",
         "ensure_row_ids",
         "extract_year_hint",
         "fuzzy_score",
+        "fuzzy_scores_pairwise",
         "is_row_processed",
         "load_credentials",
         "load_identity_overrides",
         "load_json_cache",
+        "mask_rows_processed",
         "normalize_game_name",
         "pick_best_match",
         "read_csv",
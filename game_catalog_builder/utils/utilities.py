@@ -1,22 +1,52 @@
 from __future__ import annotations
 
 import atexit
+import copy
+import heapq
 import json
 import logging
+import math
+import os
 import random
 import re
+import threading
 import time
-import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Iterator, Mapping, Sequence
 
 import pandas as pd
 import yaml
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from ..config import CACHE, RETRY
 
+try:
+    # libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:
+    # Optional fast JSON codec for the (large) provider caches.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+try:
+    import requests as _requests
+
+    _NET_EXC: tuple[type[BaseException], ...] = (
+        _requests.exceptions.ConnectionError,
+        _requests.exceptions.Timeout,
+        _requests.exceptions.SSLError,
+    )
+    _HTTP_EXC: tuple[type[BaseException], ...] = (_requests.exceptions.HTTPError,)
+except ImportError:  # pragma: no cover - requests is a core dependency
+    _NET_EXC = ()
+    _HTTP_EXC = ()
+
 IDENTITY_NOT_FOUND = "__NOT_FOUND__"
 
 # ----------------------------
@@ -34,7 +64,8 @@ def extract_year_hint(text: str) -> int | None:
     Intended for disambiguating provider search results, not for strict validation.
     """
     s = str(text or "").strip()
-    if not s:
+    # Cheap substring reject: most titles carry no 19xx/20xx run at all.
+    if not s or ("19" not in s and "20" not in s):
         return None
     m = _YEAR_HINT_RE.search(s)
     if not m:
@@ -52,6 +83,16 @@ def extract_year_hint(text: str) -> int | None:
 # Paths / Folder structure
 # ----------------------------
 
+def _ensure_dir(path: Path) -> None:
+    # Not memoized: directories can be removed while the process runs (tmp dirs, a cleaned
+    # `data/`), and `mkdir(exist_ok=True)` on an existing directory is a single cheap syscall.
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _tmp_sibling(path: Path) -> Path:
+    # Unique per process and thread, so concurrent writers of the same target never share it.
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
 
 @dataclass(frozen=True)
 class ProjectPaths:
@@ -78,10 +119,10 @@ class ProjectPaths:
         )
 
     def ensure(self) -> None:
-        self.data_input.mkdir(parents=True, exist_ok=True)
-        self.data_cache.mkdir(parents=True, exist_ok=True)
-        self.data_output.mkdir(parents=True, exist_ok=True)
-        self.data_logs.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.data_input)
+        _ensure_dir(self.data_cache)
+        _ensure_dir(self.data_output)
+        _ensure_dir(self.data_logs)
 
 
 @dataclass(frozen=True)
@@ -114,47 +155,94 @@ class RunPaths:
         )
 
     def ensure(self) -> None:
-        self.input_dir.mkdir(parents=True, exist_ok=True)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.input_dir)
+        _ensure_dir(self.output_dir)
+        _ensure_dir(self.cache_dir)
+        _ensure_dir(self.logs_dir)
 
 
 # ----------------------------
 # CSV Helpers
 # ----------------------------
 
-
 def read_csv(path: str | Path) -> pd.DataFrame:
     """Read CSV preserving strings and avoiding problematic type inference."""
-    return pd.read_csv(path, dtype=str, keep_default_na=False)
+    # na_filter=False implies keep_default_na=False and also skips the per-cell NA scan.
+    return pd.read_csv(path, dtype=str, na_filter=False, engine="c", memory_map=True)
+
+
+# Rows rendered per write_csv chunk; bounds the size of the stringified copy held in memory.
+_CSV_WRITE_CHUNK_ROWS = 50_000
 
 
 def write_csv(df: pd.DataFrame, path: str | Path) -> None:
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    """
+    Write `df` as CSV, replacing `path` atomically.
+
+    Chunks go to a temporary sibling that is `os.replace`d over the target at the end, so a
+    crash during a checkpoint never leaves a torn CSV behind.
+    """
+    p = Path(path)
+    _ensure_dir(p.parent)
     from ..metrics.csv_render import to_csv_cell
 
-    # Avoid leaking NaN/NaT into output CSVs (pandas would stringify them as "nan").
-    out = df.copy()
-    for c in out.columns:
-        out[c] = out[c].map(to_csv_cell)
-    out.to_csv(path, index=False)
+    tmp = _tmp_sibling(p)
+    try:
+        # Render and write in row chunks so large catalogs never hold a full stringified copy.
+        # The first chunk (possibly empty) writes the header; later chunks append.
+        for start in range(0, max(len(df), 1), _CSV_WRITE_CHUNK_ROWS):
+            # Avoid leaking NaN/NaT into output CSVs (pandas would stringify them as "nan").
+            out = df.iloc[start : start + _CSV_WRITE_CHUNK_ROWS].copy()
+            for c in out.columns:
+                out[c] = out[c].map(to_csv_cell)
+            if start == 0:
+                out.to_csv(tmp, index=False)
+            else:
+                out.to_csv(tmp, index=False, header=False, mode="a")
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def ensure_columns(df: pd.DataFrame, cols_with_defaults: dict[str, Any]) -> pd.DataFrame:
     """Create columns if they don't exist, with a default value."""
-    for col, default in cols_with_defaults.items():
-        if col not in df.columns:
+    missing = {col: default for col, default in cols_with_defaults.items() if col not in df.columns}
+    if not missing:
+        return df
+    if len(df) == 0:
+        # Empty lists would infer float64; scalar assignment keeps the default's dtype (object
+        # for strings), so `.str` and string comparisons keep working on empty catalogs.
+        for col, default in missing.items():
             df[col] = default
-    return df
+        return df
+    # Build all missing columns as one block and concat without copying the existing ones
+    # (per-column inserts fragment the block manager; `assign` copies the whole frame).
+    addon = pd.DataFrame(
+        {col: [default] * len(df) for col, default in missing.items()}, index=df.index
+    )
+    return pd.concat([df, addon], axis=1, copy=False)
+
+
+def _new_row_ids(count: int) -> list[str]:
+    # Existing IDs are opaque and never rewritten; new ones are 128 random bits in hex, drawn
+    # from a single os.urandom call for the whole batch.
+    raw = os.urandom(16 * count)
+    return ["rid:" + raw[i : i + 16].hex() for i in range(0, 16 * count, 16)]
 
 
 def ensure_row_ids(df: pd.DataFrame, *, col: str = "RowId") -> tuple[pd.DataFrame, int]:
     """
     Ensure a dataframe contains stable row identifiers.
 
-    Returns (df, created_count).
+    Returns (df, created_count). When every row already has a unique id the input frame is
+    returned as-is (no copy); otherwise a modified copy is returned.
     """
+    if col in df.columns:
+        vals = df[col].astype(str).fillna("").str.strip()
+        if not (vals == "").any() and not vals.duplicated().any():
+            return df, 0
+
     out = df.copy()
     created = 0
 
@@ -165,7 +253,7 @@ def ensure_row_ids(df: pd.DataFrame, *, col: str = "RowId") -> tuple[pd.DataFram
     missing_mask = vals == ""
     if missing_mask.any():
         count = int(missing_mask.sum())
-        out.loc[missing_mask, col] = [f"rid:{uuid.uuid4()}" for _ in range(count)]
+        out.loc[missing_mask, col] = _new_row_ids(count)
         created += count
 
     # Ensure uniqueness (keep first occurrence, regenerate the rest).
@@ -173,13 +261,51 @@ def ensure_row_ids(df: pd.DataFrame, *, col: str = "RowId") -> tuple[pd.DataFram
     dup_mask = vals.duplicated(keep="first")
     if dup_mask.any():
         count = int(dup_mask.sum())
-        out.loc[dup_mask, col] = [f"rid:{uuid.uuid4()}" for _ in range(count)]
+        out.loc[dup_mask, col] = _new_row_ids(count)
         created += count
 
     return out, created
 
 
-def load_identity_overrides(path: str | Path) -> dict[str, dict[str, str]]:
+_IDENTITY_OVERRIDE_COLS = (
+    "RAWG_ID",
+    "IGDB_ID",
+    "Steam_AppID",
+    "HLTB_ID",
+    "HLTB_Query",
+    "Wikidata_QID",
+)
+
+
+class IdentityTable(Mapping[str, Dict[str, str]]):
+    """
+    Read-only RowId -> {column: value} view over per-column lists.
+
+    Storing one list per override column (plus a RowId -> position index) avoids a dict per row
+    on large catalogs; the per-row dict is only materialized on lookup.
+    """
+
+    __slots__ = ("_index", "_columns")
+
+    def __init__(self, index: dict[str, int], columns: dict[str, list[str]]) -> None:
+        self._index = index
+        self._columns = columns
+
+    def __getitem__(self, rowid: str) -> dict[str, str]:
+        i = self._index[rowid]
+        return {c: vals[i] for c, vals in self._columns.items()}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, rowid: object) -> bool:
+        return rowid in self._index
+
+
+def load_identity_overrides(path: str | Path) -> IdentityTable:
     """
     Load per-row provider IDs (and HLTB query overrides) from a CSV.
 
@@ -193,64 +319,50 @@ def load_identity_overrides(path: str | Path) -> dict[str, dict[str, str]]:
     """
     p = Path(path)
     if not p.exists():
-        return {}
+        return IdentityTable({}, {})
 
     df = read_csv(p)
     if "RowId" not in df.columns:
-        return {}
+        return IdentityTable({}, {})
 
-    def col(name: str) -> pd.Series:
-        return df[name].astype(str).str.strip() if name in df.columns else pd.Series([""] * len(df))
-
-    rowids = col("RowId")
-    rawg = col("RAWG_ID")
-    igdb = col("IGDB_ID")
-    steam = col("Steam_AppID")
-    hltb_id = col("HLTB_ID") if "HLTB_ID" in df.columns else pd.Series([""] * len(df))
-    hltb_query = col("HLTB_Query") if "HLTB_Query" in df.columns else pd.Series([""] * len(df))
-    wikidata = col("Wikidata_QID") if "Wikidata_QID" in df.columns else pd.Series([""] * len(df))
-
-    out: dict[str, dict[str, str]] = {}
-    for rid, rawg_id, igdb_id, steam_id, hltb_id_val, hltb_q, qid in zip(
-        rowids.tolist(),
-        rawg.tolist(),
-        igdb.tolist(),
-        steam.tolist(),
-        hltb_id.astype(str).str.strip().tolist(),
-        hltb_query.astype(str).str.strip().tolist(),
-        wikidata.astype(str).str.strip().tolist(),
-    ):
-        if not rid:
-            continue
-        out[rid] = {
-            "RAWG_ID": rawg_id,
-            "IGDB_ID": igdb_id,
-            "Steam_AppID": steam_id,
-            "HLTB_ID": hltb_id_val,
-            "HLTB_Query": hltb_q,
-            "Wikidata_QID": qid,
-        }
-    return out
+    id_cols = list(_IDENTITY_OVERRIDE_COLS)
+    sub = df.reindex(columns=["RowId", *id_cols], fill_value="").astype(str)
+    rowids = sub["RowId"].str.strip().tolist()
+    columns = {c: sub[c].str.strip().tolist() for c in id_cols}
+
+    # Later rows win on duplicate RowIds, as with the previous dict-of-dicts.
+    index = {rid: i for i, rid in enumerate(rowids) if rid}
+    return IdentityTable(index, columns)
 
 
 # ----------------------------
 # Name normalization
 # ----------------------------
 
+# Single-pass character mapping: drop trademark symbols and apostrophes, turn brackets and
+# punctuation separators into spaces.
+_NAME_TRANSLATE = str.maketrans(
+    {
+        **{ch: None for ch in "™®©’'`"},
+        **{ch: " " for ch in "()[]{}:-–—_/\\|.,!?+*&%$#@~"},
+    }
+)
+
 _ROMAN_MAP = {
-    " i ": " 1 ",
-    " ii ": " 2 ",
-    " iii ": " 3 ",
-    " iv ": " 4 ",
-    " v ": " 5 ",
-    " vi ": " 6 ",
-    " vii ": " 7 ",
-    " viii ": " 8 ",
-    " ix ": " 9 ",
-    " x ": " 10 ",
+    "i": "1",
+    "ii": "2",
+    "iii": "3",
+    "iv": "4",
+    "v": "5",
+    "vi": "6",
+    "vii": "7",
+    "viii": "8",
+    "ix": "9",
+    "x": "10",
 }
 
 
+@lru_cache(maxsize=1 << 16)
 def normalize_game_name(name: str) -> str:
     """
     Normalize names to improve matching between catalogs.
@@ -259,20 +371,13 @@ def normalize_game_name(name: str) -> str:
     - collapse spaces
     - convert '®™' etc
     - optional: roman numerals to arabic for typical cases (I, II, III...)
-    """
-    s = (name or "").strip().lower()
-    s = s.replace("™", "").replace("®", "").replace("©", "")
-    s = re.sub(r"[\(\)\[\]\{\}]", " ", s)
-    s = re.sub(r"[’'`]", "", s)  # apostrophes
-    s = re.sub(r"[:\-–—_/\\|]", " ", s)
-    s = re.sub(r"[.,!?+*&%$#@~]", " ", s)
 
-    s = f" {s} "
-    for k, v in _ROMAN_MAP.items():
-        s = s.replace(k, v)
-
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    Memoized: the same catalog and candidate names are normalized repeatedly across providers.
+    """
+    s = (name or "").strip().lower().translate(_NAME_TRANSLATE)
+    # split()/join collapses whitespace and exposes whole tokens, so roman numerals become a dict
+    # lookup per token instead of a regex pass with a Python callback per match.
+    return " ".join([_ROMAN_MAP.get(t, t) for t in s.split()])
 
 
 # ----------------------------
@@ -280,44 +385,61 @@ def normalize_game_name(name: str) -> str:
 # ----------------------------
 
 
-_EDITION_TOKENS = {
-    "remake",
-    "hd",
-    "classic",
-    "definitive",
-    "remastered",
-    "ultimate",
-    "goty",
-    "anniversary",
-    "complete",
-    "collection",
-    "edition",
-    "enhanced",
-    "redux",
-    "vr",
-    "directors",
-    "director",
-    "cut",
-    "story",
-    "game",
-    "of",
-    "the",
-    "year",
-}
-
-_DLC_LIKE_TOKENS = {
-    "soundtrack",
-    "demo",
-    "beta",
-    "expansion",
-    "pack",
-    "season",
-    "pass",
-}
+_EDITION_TOKENS = frozenset(
+    {
+        "remake",
+        "hd",
+        "classic",
+        "definitive",
+        "remastered",
+        "ultimate",
+        "goty",
+        "anniversary",
+        "complete",
+        "collection",
+        "edition",
+        "enhanced",
+        "redux",
+        "vr",
+        "directors",
+        "director",
+        "cut",
+        "story",
+        "game",
+        "of",
+        "the",
+        "year",
+    }
+)
+
+_DLC_LIKE_TOKENS = frozenset(
+    {
+        "soundtrack",
+        "demo",
+        "beta",
+        "expansion",
+        "pack",
+        "season",
+        "pass",
+    }
+)
+
+
+_YEAR_TOKEN_RE = re.compile(r"19[0-9]{2}|20[0-9]{2}|2100")
 
 
 def _is_year_token(t: str) -> bool:
-    return t.isdigit() and len(t) == 4 and 1900 <= int(t) <= 2100
+    if _YEAR_TOKEN_RE.fullmatch(t) is not None:
+        return True
+    # ASCII tokens are fully decided by the regex; other Unicode digits (e.g. fullwidth
+    # "２０１６") still count as years, as with `str.isdigit`.
+    if t.isascii() or len(t) != 4 or not t.isdigit():
+        return False
+    try:
+        return 1900 <= int(t) <= 2100
+    except ValueError:
+        # isdigit() also accepts superscripts, which int() rejects.
+        return False
 
 
 def _token_set(s: str) -> set[str]:
@@ -346,8 +468,7 @@ def _series_numbers_tokens(tokens: set[str]) -> set[int]:
 
 
 def _looks_dlc_like(name: str) -> bool:
-    tokens = _token_set(name)
-    return any(t in tokens for t in _DLC_LIKE_TOKENS)
+    return not _DLC_LIKE_TOKENS.isdisjoint(_token_set(name))
 
 
 def fuzzy_score(a: str, b: str) -> int:
@@ -357,10 +478,45 @@ def fuzzy_score(a: str, b: str) -> int:
     Uses a conservative default (token_sort_ratio) to avoid false 100% substring matches, while
     still allowing common year/edition cases (e.g. "Doom" vs "Doom 2016") via partial_ratio.
     """
-    na = normalize_game_name(a)
-    nb = normalize_game_name(b)
-    score_sort = float(fuzz.token_sort_ratio(na, nb))
-    score_partial = float(fuzz.partial_ratio(na, nb))
+    return _fuzzy_score_normalized(normalize_game_name(a), normalize_game_name(b))
+
+
+def fuzzy_scores_pairwise(
+    left: Sequence[str], right: Sequence[str], *, workers: int = -1
+) -> list[int]:
+    """
+    `fuzzy_score(left[i], right[i])` for each aligned pair.
+
+    The token_sort_ratio pass runs as one rapidfuzz `cpdist` call (rapidfuzz >= 3.6) when
+    available, using `workers` threads (-1 = all cores); the year/edition partial_ratio
+    allowance is still applied per pair.
+    """
+    if len(left) != len(right):
+        raise ValueError("left and right must have the same length")
+    nl = [normalize_game_name(str(a or "")) for a in left]
+    nr = [normalize_game_name(str(b or "")) for b in right]
+    cpdist = getattr(process, "cpdist", None)
+    sort_scores: list[float | None] = (
+        cpdist(nl, nr, scorer=fuzz.token_sort_ratio, dtype="float64", workers=workers).tolist()
+        if cpdist is not None and nl
+        else [None] * len(nl)
+    )
+    return [_fuzzy_score_normalized(a, b, score_sort=ss) for a, b, ss in zip(nl, nr, sort_scores)]
+
+
+def _fuzzy_score_normalized(na: str, nb: str, *, score_sort: float | None = None) -> int:
+    """
+    `fuzzy_score` over names already passed through `normalize_game_name`.
+
+    `score_sort` may carry a precomputed token_sort_ratio (e.g. from a batched `cdist` call).
+    """
+    # Identical normalized names score 100 on both ratios; an empty side scores 0.
+    if na == nb:
+        return 100
+    if not na or not nb:
+        return 0
+    if score_sort is None:
+        score_sort = float(fuzz.token_sort_ratio(na, nb))
 
     tokens_a = set(na.split())
     tokens_b = set(nb.split())
@@ -372,22 +528,14 @@ def fuzzy_score(a: str, b: str) -> int:
     # "60 Seconds Santa Run".
     extra_a = tokens_a - tokens_b
     extra_b = tokens_b - tokens_a
-    year_only_a = bool(extra_a) and all(_is_year_token(t) for t in extra_a)
-    year_only_b = bool(extra_b) and all(_is_year_token(t) for t in extra_b)
-
-    edition_only_a = bool(extra_a) and all(t in _EDITION_TOKENS for t in extra_a)
-    edition_only_b = bool(extra_b) and all(t in _EDITION_TOKENS for t in extra_b)
-
-    allow_partial = (
-        (year_only_a and not extra_b)
-        or (year_only_b and not extra_a)
-        or (edition_only_a and not extra_b)
-        or (edition_only_b and not extra_a)
-    )
+    if bool(extra_a) == bool(extra_b):
+        return int(score_sort)
+    extra = extra_a or extra_b
+    allow_partial = extra.issubset(_EDITION_TOKENS) or all(map(_is_year_token, extra))
 
     if not allow_partial:
         return int(score_sort)
-    return int(max(score_sort, score_partial))
+    return int(max(score_sort, float(fuzz.partial_ratio(na, nb))))
 
 
 def pick_best_match(
@@ -404,24 +552,33 @@ def pick_best_match(
     top_matches is a list of (name, score) tuples for the top 5 matches (excluding the best itself).
     """
     scored = []
-    q_tokens = _token_set(query)
-    q_series = _series_numbers_tokens(q_tokens)
+    # Normalize the query and each candidate name once; scoring and token features reuse it.
     q_norm = normalize_game_name(query)
+    q_tokens = set(q_norm.split())
+    q_series = _series_numbers_tokens(q_tokens)
     q_has_non_year_number = any(t.isdigit() and not _is_year_token(t) for t in q_tokens)
-    for c in candidates:
-        cname = str(c.get(name_key, "") or "")
-        score = fuzzy_score(query, cname)
+    c_names = [str(c.get(name_key, "") or "") for c in candidates]
+    c_norms = [normalize_game_name(n) for n in c_names]
+    # One batched token_sort_ratio pass in rapidfuzz; partial_ratio stays per-pair since it is
+    # only needed for the year/edition superset cases.
+    sort_scores: list[float] = (
+        process.cdist([q_norm], c_norms, scorer=fuzz.token_sort_ratio, dtype="float64")[0].tolist()
+        if c_norms
+        else []
+    )
+    for c, cname, c_norm, score_sort in zip(candidates, c_names, c_norms, sort_scores):
+        score = _fuzzy_score_normalized(q_norm, c_norm, score_sort=score_sort)
 
-        c_tokens = _token_set(cname)
+        c_tokens = set(c_norm.split())
         c_series = _series_numbers_tokens(c_tokens)
-        c_norm = normalize_game_name(cname)
 
         # Penalize likely sequel matches when the query has no sequel number.
         series_penalty = 15 if (not q_series and c_series) else 0
         # Penalize different series numbers when both sides have them (e.g. "Postal 4" should not
         # match "Postal 2").
         series_penalty += 20 if (q_series and c_series and q_series.isdisjoint(c_series)) else 0
-        dlc_penalty = 20 if _looks_dlc_like(cname) else 0
+        # Reuse the candidate tokens instead of re-normalizing via `_looks_dlc_like`.
+        dlc_penalty = 20 if not _DLC_LIKE_TOKENS.isdisjoint(c_tokens) else 0
 
         diff = q_tokens.symmetric_difference(c_tokens)
         year_diff = sum(1 for t in diff if _is_year_token(t))
@@ -495,8 +652,14 @@ def pick_best_match(
             )
         )
 
+    if not scored:
+        return None, -1, []
+
+    # Only the best + top 5 are used: partial selection (same order as a stable full sort).
     # Prefer closer year match when provided.
-    scored.sort(
+    ranked = heapq.nsmallest(
+        6,
+        scored,
         key=lambda x: (
             -x[3],  # adjusted score
             -x[2],  # raw score
@@ -507,18 +670,15 @@ def pick_best_match(
             x[7],  # year token diff (lower is better)
             len(x[1]),  # shorter title
             x[8],  # smaller numeric id
-        )
+        ),
     )
 
-    if not scored:
-        return None, -1, []
-
-    best, best_name, best_score, best_adjusted, *_ = scored[0]
+    best, best_name, best_score, best_adjusted, *_ = ranked[0]
 
     # Get top 5 matches (excluding the best itself)
     top_matches = [
         (name, score)
-        for _, name, score, *_ in scored[1:6]  # Top 5 after the best
+        for _, name, score, *_ in ranked[1:6]  # Top 5 after the best
         if score > 0
     ]
 
@@ -530,20 +690,70 @@ def pick_best_match(
 # ----------------------------
 
 
+def _json_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            # Older caches written by the stdlib encoder may contain NaN/Infinity literals.
+            pass
+    return json.loads(raw)
+
+
+def _nonfinite_to_none(obj: Any) -> Any:
+    # Mirror orjson, which serializes NaN/Infinity as null, so cache bytes do not depend on
+    # which encoder is installed.
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nonfinite_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nonfinite_to_none(v) for v in obj]
+    return obj
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them.
+            pass
+    return json.dumps(_nonfinite_to_none(obj), ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def load_json_cache(path: str | Path) -> dict[str, Any]:
     p = Path(path)
     if not p.exists():
         return {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _json_loads(p.read_bytes())
     except Exception:
         return {}
 
 
 def save_json_cache(cache: dict[str, Any], path: str | Path) -> None:
+    """
+    Atomically replace the cache file, skipping the write when the content is unchanged.
+
+    Writes go to a temporary sibling that is then `os.replace`d over the target, so a crash
+    mid-write never leaves a truncated cache behind.
+    """
     p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    _ensure_dir(p.parent)
+    data = _json_dumps_bytes(cache)
+    try:
+        if p.stat().st_size == len(data) and p.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    tmp = _tmp_sibling(p)
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 # ----------------------------
@@ -554,19 +764,43 @@ def save_json_cache(cache: dict[str, Any], path: str | Path) -> None:
 class RateLimiter:
     """
     Simple rate limiter: enforces minimum interval between requests.
+
+    Thread-safe: each caller reserves the next free slot under a lock, then sleeps outside it,
+    so concurrent callers are spaced out instead of firing together.
     """
 
     def __init__(self, min_interval_s: float = 1.0):
         self.min_interval_s = float(min_interval_s)
+        self._floor_s = self.min_interval_s
         self._last = 0.0
+        self._lock = threading.Lock()
+
+    def backoff(self) -> None:
+        """
+        Multiplicative increase of the interval after a provider overload signal (429/5xx).
+        """
+        with self._lock:
+            grown = max(self.min_interval_s * 2.0, RETRY.aimd_recover_step_s)
+            self.min_interval_s = min(max(RETRY.aimd_max_interval_s, self._floor_s), grown)
+
+    def recover(self) -> None:
+        """
+        Additive decrease of the interval after a successful request, down to the configured one.
+        """
+        if self.min_interval_s <= self._floor_s:
+            return
+        with self._lock:
+            step = RETRY.aimd_recover_step_s
+            self.min_interval_s = max(self._floor_s, self.min_interval_s - step)
 
     def wait(self) -> None:
         # Use monotonic time to avoid issues if the system clock changes.
-        now = time.monotonic()
-        delta = now - self._last
-        if delta < self.min_interval_s:
-            time.sleep(self.min_interval_s - delta)
-        self._last = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last + self.min_interval_s)
+            self._last = slot
+        if slot > now:
+            time.sleep(slot - now)
 
 
 def with_retries(
@@ -579,53 +813,47 @@ def with_retries(
     on_fail_return: Any = None,
     context: str | None = None,
     retry_stats: dict[str, Any] | None = None,
+    ratelimiter: RateLimiter | None = None,
 ) -> Any:
     """
     Execute fn with retries and exponential backoff.
+
+    When `ratelimiter` is given, its pacing adapts (AIMD): 429/5xx responses double the interval
+    between requests, and each success shrinks it back toward the configured minimum.
     """
     last_exc: BaseException | None = None
     for attempt in range(retries):
         try:
-            return fn()
+            result = fn()
+            if ratelimiter is not None:
+                ratelimiter.recover()
+            return result
         except retry_on as e:
             last_exc = e
             retry_after_s: float | None = None
             status: int | None = None
             is_429 = False
-            is_network = False
-            is_http = False
-            try:
-                import requests  # local import to avoid hard dependency at import time
-
-                if isinstance(last_exc, requests.exceptions.HTTPError):
-                    is_http = True
-                    resp = getattr(last_exc, "response", None)
-                    status = getattr(resp, "status_code", None)
-                    if status == 429:
-                        is_429 = True
-                        headers = getattr(resp, "headers", {}) or {}
-                        try:
-                            ra = str(headers.get("Retry-After", "") or "").strip()
-                            if ra:
-                                retry_after_s = float(ra)
-                        except Exception:
-                            retry_after_s = None
-                        if retry_after_s is None:
-                            retry_after_s = RETRY.http_429_default_retry_after_s
-                else:
-                    net_types = (
-                        requests.exceptions.ConnectionError,
-                        requests.exceptions.Timeout,
-                        requests.exceptions.SSLError,
-                    )
-                    if isinstance(last_exc, net_types):
-                        is_network = True
-            except Exception:
-                retry_after_s = None
-                status = None
-                is_429 = False
-                is_network = False
-                is_http = False
+            is_http = isinstance(last_exc, _HTTP_EXC)
+            is_network = not is_http and isinstance(last_exc, _NET_EXC)
+            if is_http:
+                resp = getattr(last_exc, "response", None)
+                status = getattr(resp, "status_code", None)
+                if status == 429:
+                    is_429 = True
+                    headers = getattr(resp, "headers", {}) or {}
+                    try:
+                        ra = str(headers.get("Retry-After", "") or "").strip()
+                        if ra:
+                            retry_after_s = float(ra)
+                    except Exception:
+                        retry_after_s = None
+                    if retry_after_s is None:
+                        retry_after_s = RETRY.http_429_default_retry_after_s
+
+            if ratelimiter is not None and (is_429 or (status is not None and status >= 500)):
+                ratelimiter.backoff()
+                if retry_stats is not None:
+                    retry_stats["rate_backoffs"] = int(retry_stats.get("rate_backoffs", 0)) + 1
 
             if retry_stats is not None:
                 if is_429:
@@ -639,23 +867,8 @@ def with_retries(
                 if context and last_exc is not None:
                     # Make network-offline situations obvious in logs, and distinct from
                     # provider "not found" cases.
-                    try:
-                        import requests  # local import to avoid hard dependency at import time
-
-                        net_types = (
-                            requests.exceptions.ConnectionError,
-                            requests.exceptions.Timeout,
-                            requests.exceptions.SSLError,
-                        )
-                        http_types = (requests.exceptions.HTTPError,)
-                        if isinstance(last_exc, net_types):
-                            logging.error(f"[NETWORK] {context}: {type(last_exc).__name__}: {last_exc}")
-                        elif isinstance(last_exc, http_types):
-                            logging.error(f"[HTTP] {context}: {type(last_exc).__name__}: {last_exc}")
-                        else:
-                            logging.error(f"[REQUEST] {context}: {type(last_exc).__name__}: {last_exc}")
-                    except Exception:
-                        logging.error(f"[REQUEST] {context}: {type(last_exc).__name__}: {last_exc}")
+                    kind = "NETWORK" if is_network else "HTTP" if is_http else "REQUEST"
+                    logging.error(f"[{kind}] {context}: {type(last_exc).__name__}: {last_exc}")
                 if retry_stats is not None:
                     if is_network:
                         retry_stats["network_failures"] = int(retry_stats.get("network_failures", 0)) + 1
@@ -677,12 +890,8 @@ def with_retries(
 
 
 def network_failures_count(stats: dict[str, Any] | None) -> int:
-    if not stats:
-        return 0
-    try:
-        return int(stats.get("network_failures", 0) or 0)
-    except Exception:
-        return 0
+    # `with_retries` is the only writer of this key and always stores an int.
+    return stats.get("network_failures", 0) if stats else 0
 
 
 def raise_on_new_network_failure(stats: dict[str, Any] | None, *, before: int, context: str) -> None:
@@ -773,12 +982,15 @@ class CacheIOTracker:
         return f"{prefix} load_ms={load_ms} saves={save_count} save_ms={save_ms}"
 
 
-def iter_chunks(items: list[Any], chunk_size: int) -> list[list[Any]]:
+def iter_chunks(items: list[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """
+    Lazily yield consecutive slices of `items` with at most `chunk_size` elements each.
+
+    Callers iterate once, so slices are produced on demand instead of materializing every chunk.
+    """
     if chunk_size <= 0:
         raise ValueError("chunk_size must be > 0")
-    if not items:
-        return []
-    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    return (items[i : i + chunk_size] for i in range(0, len(items), chunk_size))
 
 
 # ----------------------------
@@ -789,6 +1001,9 @@ def iter_chunks(items: list[Any], chunk_size: int) -> list[list[Any]]:
 def is_row_processed(df: pd.DataFrame, idx: int, required_cols: list[str]) -> bool:
     """
     Consider 'processed' if all required columns have non-empty values.
+
+    Single-row check for code that must observe concurrent writes; row loops should compute
+    `mask_rows_processed` once instead.
     """
     for col in required_cols:
         if col not in df.columns:
@@ -799,11 +1014,31 @@ def is_row_processed(df: pd.DataFrame, idx: int, required_cols: list[str]) -> bo
     return True
 
 
+def mask_rows_processed(df: pd.DataFrame, required_cols: list[str]) -> list[bool]:
+    """
+    Vectorized `is_row_processed` for every row, indexed by position.
+
+    Prefer computing this once before a row loop instead of calling `is_row_processed` per row.
+    """
+    if any(col not in df.columns for col in required_cols):
+        return [False] * len(df)
+    mask = pd.Series(True, index=df.index)
+    for col in required_cols:
+        vals = df[col]
+        # Match `str(val or "")`: falsy cells (None, "") count as empty.
+        vals = vals.where(vals.astype(bool), "")
+        mask &= vals.astype(str).str.strip().ne("")
+    return mask.tolist()
+
+
 # ----------------------------
 # Credentials loading
 # ----------------------------
 
 
+_CREDENTIALS_MEMO: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+
 def load_credentials(credentials_path: str | Path | None = None) -> dict[str, Any]:
     """
     Load credentials from a YAML file.
@@ -829,5 +1064,15 @@ def load_credentials(credentials_path: str | Path | None = None) -> dict[str, An
             "Please create data/credentials.yaml with your API keys."
         )
 
-    with open(credentials_path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # Credentials are loaded by every pipeline context/subcommand; parse the YAML once per file
+    # version and hand out copies so callers can't mutate the memoized dict.
+    st = os.stat(credentials_path)
+    key = (str(credentials_path), st.st_mtime_ns, st.st_size)
+    cached = _CREDENTIALS_MEMO.get(key)
+    if cached is None:
+        with open(credentials_path, "rb") as f:
+            cached = yaml.load(f, Loader=_YamlLoader) or {}
+        _CREDENTIALS_MEMO.clear()
+        _CREDENTIALS_MEMO[key] = cached
+    return copy.deepcopy(cached)
+
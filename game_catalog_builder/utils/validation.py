@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 
 import pandas as pd
 
@@ -13,7 +21,7 @@ from .consistency import (
     platform_outlier_tags,
     year_outlier_tags,
 )
-from .utilities import fuzzy_score, normalize_game_name
+from .utilities import fuzzy_scores_pairwise, normalize_game_name
 
 
 def _as_str_list(value: object) -> list[str]:
@@ -22,6 +30,7 @@ def _as_str_list(value: object) -> list[str]:
     return []
 
 
+@lru_cache(maxsize=4096)
 def _normalize_platform_token(token: str) -> str:
     t = (token or "").strip().lower()
     if not t:
@@ -43,22 +52,39 @@ def _normalize_platform_token(token: str) -> str:
 
 
 def _normalize_platforms(platforms: object) -> set[str]:
+    # Provider platform lists repeat heavily across a catalog; memoize on the token tuple and
+    # return a fresh set so callers can keep using set operations on the result.
+    return set(_normalize_platform_tuple(tuple(_as_str_list(platforms))))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_platform_tuple(tokens: tuple[str, ...]) -> frozenset[str]:
     out: set[str] = set()
-    for token in _as_str_list(platforms):
+    for token in tokens:
         norm = _normalize_platform_token(token)
         if norm:
             out.add(norm)
-    return out
+    return frozenset(out)
+
 
+def _as_year_ints(values: list[str]) -> list[int | None]:
+    """
+    Parse a column of year strings: 4 digits within 1900-2100, else None.
 
-def _as_year_int(s: str) -> int | None:
-    s = (s or "").strip()
-    if len(s) != 4 or not s.isdigit():
-        return None
-    y = int(s)
-    if 1900 <= y <= 2100:
-        return y
-    return None
+    Any Unicode decimal digits count (e.g. fullwidth "２０１６"), matching `str.isdigit`.
+    """
+    out: list[int | None] = []
+    for v in values:
+        s = (v or "").strip()
+        y = None
+        if len(s) == 4 and s.isdigit():
+            try:
+                y = int(s)
+            except ValueError:
+                # isdigit() also accepts superscripts, which int() rejects.
+                pass
+        out.append(y if y is not None and 1900 <= y <= 2100 else None)
+    return out
 
 
 @dataclass(frozen=True)
@@ -67,59 +93,64 @@ class ValidationThresholds:
     year_max_diff: int = VALIDATION.year_max_diff
 
 
-_STEAM_EDITION_TOKENS = {
-    "remake",
-    "hd",
-    "classic",
-    "definitive",
-    "remastered",
-    "ultimate",
-    "goty",
-    "anniversary",
-    "complete",
-    "collection",
-    "edition",
-    "enhanced",
-    "redux",
-    "vr",
-    "directors",
-    "director",
-    "deluxe",
-    "gold",
-    "platinum",
-}
+_STEAM_EDITION_TOKENS = frozenset(
+    {
+        "remake",
+        "hd",
+        "classic",
+        "definitive",
+        "remastered",
+        "ultimate",
+        "goty",
+        "anniversary",
+        "complete",
+        "collection",
+        "edition",
+        "enhanced",
+        "redux",
+        "vr",
+        "directors",
+        "director",
+        "deluxe",
+        "gold",
+        "platinum",
+    }
+)
 
 
-_DLC_TOKENS = {
-    "dlc",
-    "soundtrack",
-    "demo",
-    "beta",
-    "season",
-    "pass",
-    "expansion",
-    "pack",
-}
+_DLC_TOKENS = frozenset(
+    {
+        "dlc",
+        "soundtrack",
+        "demo",
+        "beta",
+        "season",
+        "pass",
+        "expansion",
+        "pack",
+    }
+)
 
 
-def _edition_tokens(title: str) -> set[str]:
+@lru_cache(maxsize=1 << 16)
+def _edition_tokens(title: str) -> frozenset[str]:
     """
     Extract a small set of edition/port/remaster tokens from a title for cross-provider comparison.
+
+    Memoized (titles repeat across rows), so the result is immutable.
     """
     t = normalize_game_name(title)
-    tokens = set(t.split())
-    out = {tok for tok in tokens if tok in _STEAM_EDITION_TOKENS}
+    out = set(t.split()) & _STEAM_EDITION_TOKENS
     if "game of the year" in t:
         out.add("goty")
     if "director s cut" in t or "directors cut" in t:
         out.add("directors")
-    return out
+    return frozenset(out)
 
 
 def _steam_looks_like_dlc(steam_name: str, steam_categories: object) -> bool:
     t = normalize_game_name(steam_name)
-    tokens = set(t.split())
-    if any(tok in tokens for tok in _DLC_TOKENS):
+    if not _DLC_TOKENS.isdisjoint(t.split()):
         return True
     cats_list = _as_str_list(steam_categories)
     cats = normalize_game_name(", ".join(cats_list)) if cats_list else ""
@@ -128,20 +159,21 @@ def _steam_looks_like_dlc(steam_name: str, steam_categories: object) -> bool:
     return False
 
 
+# Cyrillic + Cyrillic Supplement blocks.
+_CYRILLIC_RE = re.compile("[\u0400-\u052f]")
+
+
 def _contains_cyrillic(s: str) -> bool:
-    for ch in s or "":
-        o = ord(ch)
-        # Cyrillic + Cyrillic Supplement blocks
-        if 0x0400 <= o <= 0x052F:
-            return True
-    return False
+    return bool(s) and _CYRILLIC_RE.search(s) is not None
 
 
-def _series_numbers(title: str) -> set[int]:
+@lru_cache(maxsize=1 << 16)
+def _series_numbers(title: str) -> frozenset[int]:
     """
     Extract sequel/series numbers from a title, excluding likely years (1900-2100).
 
     Uses normalize_game_name() which already converts common roman numerals to digits.
+    Memoized, so the result is immutable.
     """
     tokens = normalize_game_name(title).split()
     out: set[int] = set()
@@ -161,12 +193,12 @@ def _series_numbers(title: str) -> set[int]:
             continue
         if 0 <= n <= 50:
             out.add(n)
-    return out
+    return frozenset(out)
 
 
+@lru_cache(maxsize=1 << 16)
 def _steam_is_edition_or_port(steam_name: str) -> bool:
-    tokens = set(normalize_game_name(steam_name).split())
-    return any(t in tokens for t in _STEAM_EDITION_TOKENS)
+    return not _STEAM_EDITION_TOKENS.isdisjoint(normalize_game_name(steam_name).split())
 
 
 def _pick_title_culprit(
@@ -177,7 +209,9 @@ def _pick_title_culprit(
     score_hltb: str,
     threshold: int,
 ) -> str:
-    scored: list[tuple[str, int]] = []
+    # Single pass: the first provider (in this order) with the lowest sub-threshold score.
+    culprit = ""
+    lowest = threshold
     for k, s in (
         ("RAWG", score_rawg),
         ("IGDB", score_igdb),
@@ -185,13 +219,10 @@ def _pick_title_culprit(
         ("HLTB", score_hltb),
     ):
         if s.strip().isdigit():
-            scored.append((k, int(s)))
-    if not scored:
-        return ""
-    scored.sort(key=lambda x: x[1])  # lowest first
-    if scored[0][1] < threshold:
-        return scored[0][0]
-    return ""
+            v = int(s)
+            if v < lowest:
+                culprit, lowest = k, v
+    return culprit
 
 
 def _year_diff(a: int | None, b: int | None) -> str:
@@ -200,25 +231,36 @@ def _year_diff(a: int | None, b: int | None) -> str:
     return str(a - b)
 
 
-def _suggest_canonical_title(row: dict[str, str]) -> tuple[str, str, str, str, int, str]:
+_CANONICAL_SOURCE_ORDER = ("Steam", "RAWG", "IGDB", "HLTB")
+_CANONICAL_SOURCE_RANK = {src: i for i, src in enumerate(_CANONICAL_SOURCE_ORDER)}
+
+
+def _suggest_canonical_title(
+    steam_name: str, rawg_name: str, igdb_name: str, hltb_name: str
+) -> tuple[str, str, str, str, int, str]:
     """
+    Suggest a canonical title from the (already stripped) provider titles.
+
     Returns:
         (canonical_title, canonical_source, suggested_personal_name, reason, consensus_count,
          consensus_sources)
     """
-    candidates: list[tuple[str, str]] = []
-    for src, col in (
-        ("Steam", "Steam_Name"),
-        ("RAWG", "RAWG_Name"),
-        ("IGDB", "IGDB_Name"),
-        ("HLTB", "HLTB_Name"),
-    ):
-        t = str(row.get(col, "") or "").strip()
-        if t:
-            candidates.append((src, t))
+    candidates = [
+        (src, t)
+        for src, t in (
+            ("Steam", steam_name),
+            ("RAWG", rawg_name),
+            ("IGDB", igdb_name),
+            ("HLTB", hltb_name),
+        )
+        if t
+    ]
 
     if not candidates:
         return "", "", "", "no provider titles available", 0, ""
+    if len(candidates) == 1:
+        src, title = candidates[0]
+        return title, src, title, f"single provider title ({src})", 1, ""
 
     # Group by normalized title to find consensus.
     groups: dict[str, list[tuple[str, str]]] = {}
@@ -227,17 +269,19 @@ def _suggest_canonical_title(row: dict[str, str]) -> tuple[str, str, str, str, i
         groups.setdefault(key, []).append((src, title))
 
     # Choose the largest group; tie-break by source preference.
-    preferred_order = ["Steam", "RAWG", "IGDB", "HLTB"]
+    preferred_order = _CANONICAL_SOURCE_ORDER
 
     def group_rank(items: list[tuple[str, str]]) -> tuple[int, int]:
         count = len(items)
         # best (lowest) source index present in the group.
         best_src = min(
-            (preferred_order.index(src) for src, _ in items if src in preferred_order), default=999
+            (_CANONICAL_SOURCE_RANK[src] for src, _ in items if src in _CANONICAL_SOURCE_RANK),
+            default=999,
         )
         return (count, -best_src)
 
-    best_key, best_items = sorted(groups.items(), key=lambda kv: group_rank(kv[1]), reverse=True)[0]
+    # max() keeps the first group among ties, like the stable reverse sort it replaces.
+    best_key, best_items = max(groups.items(), key=lambda kv: group_rank(kv[1]))
 
     # Representative title: prefer Steam if present in group, else other sources.
     rep_title = ""
@@ -272,12 +316,18 @@ def generate_validation_report(
     *,
     thresholds: ValidationThresholds | None = None,
     enabled_providers: set[str] | None = None,
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """
     Produce a per-row cross-provider consistency report for the merged CSV.
     """
     return render_validation_report(
-        generate_validation_metrics(df, thresholds=thresholds, enabled_providers=enabled_providers)
+        generate_validation_metrics(
+            df,
+            thresholds=thresholds,
+            enabled_providers=enabled_providers,
+            max_workers=max_workers,
+        )
     )
 
 
@@ -323,38 +373,142 @@ def render_validation_report(rows: list[dict[str, str]]) -> pd.DataFrame:
     return pd.DataFrame(out_rows)
 
 
+def _validation_workers(n_rows: int, max_workers: int | None) -> int:
+    if max_workers is not None:
+        return max(1, min(max_workers or os.cpu_count() or 1, n_rows))
+    if VALIDATION.parallel_workers == 1 or n_rows < VALIDATION.parallel_min_rows:
+        return 1
+    return max(1, min(VALIDATION.parallel_workers or os.cpu_count() or 1, n_rows))
+
+
 def generate_validation_metrics(
     df: pd.DataFrame,
     *,
     thresholds: ValidationThresholds | None = None,
     enabled_providers: set[str] | None = None,
+    max_workers: int | None = None,
 ) -> list[dict[str, str]]:
     """
     Produce per-row cross-provider consistency rows using dotted keys, then render using
     `render_validation_report()`.
+
+    Rows are independent, so when enabled via `VALIDATION.parallel_workers` large frames (see
+    `VALIDATION.parallel_min_rows`) are split into contiguous chunks processed in spawned worker
+    processes; `max_workers` (e.g. from `--validation-workers`) overrides the configured worker
+    count and threshold (1 forces the serial path, 0 uses one worker per CPU).
     """
     if thresholds is None:
         thresholds = ValidationThresholds()
     enabled = {p.strip().lower() for p in (enabled_providers or set()) if p.strip()}
-    rows: list[dict[str, str]] = []
-
-    for _, r in df.iterrows():
-        name = str(r.get("Name", "") or "").strip()
 
-        rawg_name = str(r.get("RAWG_Name", "") or "").strip()
-        igdb_name = str(r.get("IGDB_Name", "") or "").strip()
-        steam_name = str(r.get("Steam_Name", "") or "").strip()
-        hltb_name = str(r.get("HLTB_Name", "") or "").strip()
+    workers = _validation_workers(len(df), max_workers)
+    if workers <= 1:
+        return _validation_metrics_chunk(df, thresholds, enabled)
+
+    step = -(-len(df) // workers)
+    chunks = [df.iloc[i : i + step] for i in range(0, len(df), step)]
+    # Spawn rather than fork: enrich calls this while provider threads (and their locks) exist.
+    # Each worker scores with a single rapidfuzz thread so the pool does not oversubscribe cores.
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            parts = list(
+                pool.map(
+                    _validation_metrics_chunk,
+                    chunks,
+                    repeat(thresholds),
+                    repeat(enabled),
+                    repeat(1),
+                )
+            )
+    except (OSError, BrokenProcessPool) as e:
+        logging.warning(f"Validation worker pool unavailable ({e}); falling back to serial run")
+        return _validation_metrics_chunk(df, thresholds, enabled)
+    return [row for part in parts for row in part]
 
-        score_rawg = str(fuzzy_score(name, rawg_name)) if rawg_name else ""
-        score_igdb = str(fuzzy_score(name, igdb_name)) if igdb_name else ""
-        score_steam = str(fuzzy_score(name, steam_name)) if steam_name else ""
-        score_hltb = str(fuzzy_score(name, hltb_name)) if hltb_name else ""
 
-        rawg_year = _as_year_int(str(r.get("RAWG_Year", "") or ""))
-        igdb_year = _as_year_int(str(r.get("IGDB_Year", "") or ""))
-        steam_year = _as_year_int(str(r.get("Steam_ReleaseYear", "") or ""))
-        hltb_year = _as_year_int(str(r.get("HLTB_ReleaseYear", "") or ""))
+def _validation_metrics_chunk(
+    df: pd.DataFrame,
+    thresholds: ValidationThresholds,
+    enabled: set[str],
+    fuzzy_workers: int = -1,
+) -> list[dict[str, str]]:
+    rows: list[dict[str, str]] = []
+    columns = set(df.columns)
+    # Read once; these are consulted many times per row.
+    title_warn = thresholds.title_score_warn
+    year_max_diff = thresholds.year_max_diff
+
+    # Plain dict records are far cheaper per row than the Series objects `iterrows` builds, and
+    # `r.get(...)` keeps the same missing-column semantics.
+    records = df.to_dict("records")
+
+    def _column(col: str) -> list[str]:
+        return [str(r.get(col, "") or "").strip() for r in records]
+
+    names = _column("Name")
+    # Other stripped text columns read in the loop (ids, appids, store type).
+    text = {
+        col: _column(col)
+        for col in (
+            "RAWG_ID",
+            "IGDB_ID",
+            "Steam_AppID",
+            "IGDB_SteamAppID",
+            "HLTB_Main",
+            "SteamSpy_Owners",
+            "Steam_StoreType",
+        )
+    }
+    titles = {col: _column(col) for col in ("RAWG_Name", "IGDB_Name", "Steam_Name", "HLTB_Name")}
+    # Per-provider "no id/data" masks, limited to enabled providers whose column exists.
+    missing_by_provider = [
+        (prov, [not v for v in text[col]])
+        for prov, col in (
+            ("RAWG", "RAWG_ID"),
+            ("IGDB", "IGDB_ID"),
+            ("Steam", "Steam_AppID"),
+            ("HLTB", "HLTB_Main"),
+            ("SteamSpy", "SteamSpy_Owners"),
+        )
+        if (not enabled or prov.lower() in enabled) and col in columns
+    ]
+    year_cols = ("RAWG_Year", "IGDB_Year", "Steam_ReleaseYear", "HLTB_ReleaseYear")
+    year_ints = {col: _as_year_ints(_column(col)) for col in year_cols}
+    # Score each provider title against the row name column-wise (one batched rapidfuzz pass per
+    # provider) instead of four scalar fuzzy_score calls per row.
+    score_ints = pd.DataFrame(
+        {
+            col: fuzzy_scores_pairwise(names, ts, workers=fuzzy_workers)
+            for col, ts in titles.items()
+        },
+        dtype="int64",
+    )
+    has_title = pd.DataFrame({col: [bool(t) for t in ts] for col, ts in titles.items()})
+    # A row is a title mismatch when any provider with a title scores below the threshold.
+    title_mismatch_rows = ((score_ints < title_warn) & has_title).any(axis=1).tolist()
+    scores = {
+        col: [str(sc) if t else "" for t, sc in zip(ts, score_ints[col].tolist())]
+        for col, ts in titles.items()
+    }
+
+    for i, r in enumerate(records):
+        name = names[i]
+
+        rawg_name = titles["RAWG_Name"][i]
+        igdb_name = titles["IGDB_Name"][i]
+        steam_name = titles["Steam_Name"][i]
+        hltb_name = titles["HLTB_Name"][i]
+
+        score_rawg = scores["RAWG_Name"][i]
+        score_igdb = scores["IGDB_Name"][i]
+        score_steam = scores["Steam_Name"][i]
+        score_hltb = scores["HLTB_Name"][i]
+
+        rawg_year = year_ints["RAWG_Year"][i]
+        igdb_year = year_ints["IGDB_Year"][i]
+        steam_year = year_ints["Steam_ReleaseYear"][i]
+        hltb_year = year_ints["HLTB_ReleaseYear"][i]
 
         years: list[tuple[str, int]] = []
         if rawg_year is not None:
@@ -367,11 +521,17 @@ def generate_validation_metrics(
             years.append(("HLTB", hltb_year))
 
         steam_is_edition = _steam_is_edition_or_port(steam_name)
-        steam_is_dlc = _steam_looks_like_dlc(str(r.get("Steam_Name", "") or ""), r.get("Steam_Categories"))
+        steam_is_dlc = _steam_looks_like_dlc(steam_name, r.get("Steam_Categories"))
+
+        # Normalized platform sets per provider, computed once per row and reused below.
+        plat_rawg = _normalize_platforms(r.get("RAWG_Platforms"))
+        plat_igdb = _normalize_platforms(r.get("IGDB_Platforms"))
+        plat_steam = _normalize_platforms(r.get("Steam_Platforms"))
+        plat_hltb = _normalize_platforms(r.get("HLTB_Platforms"))
 
         year_disagree_rawg_igdb = ""
         if rawg_year is not None and igdb_year is not None:
-            if abs(rawg_year - igdb_year) > thresholds.year_max_diff:
+            if abs(rawg_year - igdb_year) > year_max_diff:
                 year_disagree_rawg_igdb = "YES"
 
         steam_year_disagree = ""
@@ -379,16 +539,16 @@ def generate_validation_metrics(
         steam_year_diff_vs_igdb = _year_diff(steam_year, igdb_year)
         if steam_year is not None:
             primary = igdb_year if igdb_year is not None else rawg_year
-            if primary is not None and abs(steam_year - primary) > thresholds.year_max_diff:
+            if primary is not None and abs(steam_year - primary) > year_max_diff:
                 # Steam years often represent ports/remasters/HD releases; treat this as
                 # informational unless paired with other identity disagreements.
                 if not steam_is_edition:
                     steam_year_disagree = "YES"
 
         platforms = [
-            ("RAWG", _normalize_platforms(r.get("RAWG_Platforms"))),
-            ("IGDB", _normalize_platforms(r.get("IGDB_Platforms"))),
-            ("Steam", _normalize_platforms(r.get("Steam_Platforms"))),
+            ("RAWG", plat_rawg),
+            ("IGDB", plat_igdb),
+            ("Steam", plat_steam),
         ]
         non_empty = [(k, s) for k, s in platforms if s]
         platform_disagree = ""
@@ -399,17 +559,13 @@ def generate_validation_metrics(
             if not inter:
                 platform_disagree = "YES"
 
-        steam_appid = str(r.get("Steam_AppID", "") or "").strip()
-        igdb_steam_appid = str(r.get("IGDB_SteamAppID", "") or "").strip()
+        steam_appid = text["Steam_AppID"][i]
+        igdb_steam_appid = text["IGDB_SteamAppID"][i]
         steam_appid_mismatch = ""
         if steam_appid and igdb_steam_appid and steam_appid != igdb_steam_appid:
             steam_appid_mismatch = "YES"
 
-        title_mismatch = ""
-        for s in (score_rawg, score_igdb, score_steam, score_hltb):
-            if s and int(s) < thresholds.title_score_warn:
-                title_mismatch = "YES"
-                break
+        title_mismatch = "YES" if title_mismatch_rows[i] else ""
 
         # Edition token comparison across provider titles.
         edition_by_src = {
@@ -446,10 +602,10 @@ def generate_validation_metrics(
 
         # Series number mismatch (e.g. "Assassin's Creed 2" vs "Assassin's Creed 3").
         series_by_src = {
-            "RAWG": _series_numbers(rawg_name) if rawg_name else set(),
-            "IGDB": _series_numbers(igdb_name) if igdb_name else set(),
-            "Steam": _series_numbers(steam_name) if steam_name else set(),
-            "HLTB": _series_numbers(hltb_name) if hltb_name else set(),
+            "RAWG": _series_numbers(rawg_name) if rawg_name else frozenset(),
+            "IGDB": _series_numbers(igdb_name) if igdb_name else frozenset(),
+            "Steam": _series_numbers(steam_name) if steam_name else frozenset(),
+            "HLTB": _series_numbers(hltb_name) if hltb_name else frozenset(),
         }
         series_compared = {k: v for k, v in series_by_src.items() if v}
         series_disagree = ""
@@ -459,33 +615,17 @@ def generate_validation_metrics(
             f"{k}:{','.join(str(x) for x in sorted(v))}" for k, v in series_by_src.items() if v
         )
 
-        not_found: list[str] = []
-        for prov, col in (
-            ("RAWG", "RAWG_ID"),
-            ("IGDB", "IGDB_ID"),
-            ("Steam", "Steam_AppID"),
-            ("HLTB", "HLTB_Main"),
-            ("SteamSpy", "SteamSpy_Owners"),
-        ):
-            if enabled and prov.lower() not in enabled:
-                continue
-            if col not in df.columns:
-                continue
+        not_found = [
+            prov
+            for prov, missing in missing_by_provider
             # SteamSpy only applies when we have a Steam AppID.
-            if prov == "SteamSpy" and not steam_appid:
-                continue
-            if not str(r.get(col, "") or "").strip():
-                not_found.append(prov)
+            if missing[i] and (prov != "SteamSpy" or steam_appid)
+        ]
 
         validation_tags: list[str] = []
         # Missing-provider severity: for clearly non-PC titles, treat missing Steam/SteamSpy as
         # informational (still recorded in MissingProviders).
-        platforms_union = (
-            _normalize_platforms(r.get("RAWG_Platforms"))
-            | _normalize_platforms(r.get("IGDB_Platforms"))
-            | _normalize_platforms(r.get("Steam_Platforms"))
-            | _normalize_platforms(r.get("HLTB_Platforms"))
-        )
+        platforms_union = plat_rawg | plat_igdb | plat_steam | plat_hltb
         is_pc_like = "pc" in platforms_union
 
         for prov in not_found:
@@ -497,7 +637,7 @@ def generate_validation_metrics(
             else:
                 validation_tags.append(f"missing:{prov}")
 
-        steam_store_type = str(r.get("Steam_StoreType", "") or "").strip().lower()
+        steam_store_type = text["Steam_StoreType"][i].lower()
         if steam_store_type and steam_store_type != "game":
             validation_tags.append(f"store_type_not_game:{steam_store_type}")
 
@@ -509,14 +649,14 @@ def generate_validation_metrics(
                 score_igdb=score_igdb,
                 score_steam=score_steam,
                 score_hltb=score_hltb,
-                threshold=thresholds.title_score_warn,
+                threshold=title_warn,
             )
             if title_culprit:
                 culprit = title_culprit
             else:
                 # Most often the IGDB match is wrong if Steam matched the input name well.
                 culprit = (
-                    "IGDB" if (score_steam and int(score_steam) >= thresholds.title_score_warn) else "Steam"
+                    "IGDB" if (score_steam and int(score_steam) >= title_warn) else "Steam"
                 )
         elif platform_disagree == "YES":
             # A single odd platform set (e.g. web-only) is often a bad match.
@@ -528,14 +668,14 @@ def generate_validation_metrics(
                     score_igdb=score_igdb,
                     score_steam=score_steam,
                     score_hltb=score_hltb,
-                    threshold=thresholds.title_score_warn,
+                    threshold=title_warn,
                 )
         elif year_disagree_rawg_igdb == "YES":
             # If Steam exists and strongly agrees with one year, blame the other.
             if steam_year is not None:
-                if rawg_year is not None and abs(steam_year - rawg_year) <= thresholds.year_max_diff:
+                if rawg_year is not None and abs(steam_year - rawg_year) <= year_max_diff:
                     culprit = "IGDB"
-                elif igdb_year is not None and abs(steam_year - igdb_year) <= thresholds.year_max_diff:
+                elif igdb_year is not None and abs(steam_year - igdb_year) <= year_max_diff:
                     culprit = "RAWG"
             if not culprit:
                 culprit = "RAWG/IGDB"
@@ -545,7 +685,7 @@ def generate_validation_metrics(
                 score_igdb=score_igdb,
                 score_steam=score_steam,
                 score_hltb=score_hltb,
-                threshold=thresholds.title_score_warn,
+                threshold=title_warn,
             )
 
         if steam_is_dlc:
@@ -560,7 +700,7 @@ def generate_validation_metrics(
             suggestion_reason,
             consensus_count,
             consensus_sources,
-        ) = _suggest_canonical_title({k: str(v or "") for k, v in r.to_dict().items()})
+        ) = _suggest_canonical_title(steam_name, rawg_name, igdb_name, hltb_name)
         suggested_rename = ""
         review_title = "YES" if steam_is_dlc else ""
         review_reason = "steam looks like dlc/demo" if steam_is_dlc else ""
@@ -652,15 +792,15 @@ def generate_validation_metrics(
             validation_tags.extend(consensus.tags())
 
         platform_sets = {
-            "rawg": _normalize_platforms(r.get("RAWG_Platforms")),
-            "igdb": _normalize_platforms(r.get("IGDB_Platforms")),
-            "steam": _normalize_platforms(r.get("Steam_Platforms")),
-            "hltb": _normalize_platforms(r.get("HLTB_Platforms")),
+            "rawg": plat_rawg,
+            "igdb": plat_igdb,
+            "steam": plat_steam,
+            "hltb": plat_hltb,
         }
         platform_tags = platform_outlier_tags(platform_sets)
         validation_tags.extend(platform_tags)
 
-        year_tags = year_outlier_tags(years_map, max_diff=thresholds.year_max_diff)
+        year_tags = year_outlier_tags(years_map, max_diff=year_max_diff)
         validation_tags.extend(year_tags)
 
         def _normalize_genres(genres: object) -> set[str]:
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def test_igdb_enrich_does_not_checkpoint_every_pending_row(tmp_path: Path, monkeypatch):
+    from game_catalog_builder.metrics.registry import load_metrics_registry
+    from game_catalog_builder.pipelines import enrich_pipeline
+    from game_catalog_builder.utils.utilities import write_csv
+
+    input_csv = tmp_path / "Games_User.csv"
+    write_csv(
+        pd.DataFrame(
+            [{"RowId": f"rid:{i}", "Name": f"Game {i}", "IGDB_ID": str(i)} for i in range(1, 6)]
+        ),
+        input_csv,
+    )
+    (tmp_path / "metrics.yaml").write_text(
+        "version: 2\nmetrics:\n  igdb.name: { column: IGDB_Name, type: string }\n",
+        encoding="utf-8",
+    )
+    registry = load_metrics_registry(tmp_path / "metrics.yaml")
+
+    writes: list[Path] = []
+    monkeypatch.setattr(
+        enrich_pipeline, "write_provider_output_csv", lambda _df, path, **_kw: writes.append(path)
+    )
+    monkeypatch.setattr(
+        "game_catalog_builder.clients.igdb_client.IGDBClient.get_by_ids",
+        lambda _self, ids: {str(i): {"igdb.name": f"Game {i}"} for i in ids},
+    )
+
+    df = enrich_pipeline.process_igdb(
+        input_csv=input_csv,
+        output_csv=tmp_path / "Provider_IGDB.csv",
+        cache_path=tmp_path / "igdb_cache.json",
+        credentials={},
+        required_cols=["IGDB_Name"],
+        registry=registry,
+    )
+
+    # Pinned ids only count as processed once the batch is flushed; until then no row may
+    # trigger a checkpoint, leaving just the final write.
+    assert len(writes) == 1
+    assert df["IGDB_Name"].tolist() == [f"Game {i}" for i in range(1, 6)]
+
+
+def test_wikidata_enrich_does_not_checkpoint_on_progress_cadence(tmp_path: Path, monkeypatch):
+    from game_catalog_builder.config import CLI
+    from game_catalog_builder.metrics.registry import load_metrics_registry
+    from game_catalog_builder.pipelines import enrich_pipeline
+    from game_catalog_builder.utils.utilities import write_csv
+
+    # More rows than the progress cadence, fewer than one get_by_ids batch.
+    n = CLI.progress_every_n + 5
+    input_csv = tmp_path / "Games_User.csv"
+    write_csv(
+        pd.DataFrame(
+            [
+                {"RowId": f"rid:{i}", "Name": f"Game {i}", "Wikidata_QID": f"Q{i}"}
+                for i in range(1, n + 1)
+            ]
+        ),
+        input_csv,
+    )
+    (tmp_path / "metrics.yaml").write_text(
+        "version: 2\nmetrics:\n  wikidata.label: { column: Wikidata_Label, type: string }\n",
+        encoding="utf-8",
+    )
+    registry = load_metrics_registry(tmp_path / "metrics.yaml")
+
+    writes: list[Path] = []
+    monkeypatch.setattr(
+        enrich_pipeline, "write_provider_output_csv", lambda _df, path, **_kw: writes.append(path)
+    )
+    monkeypatch.setattr(
+        "game_catalog_builder.clients.wikidata_client.WikidataClient.get_by_ids",
+        lambda _self, qids: {q: {"wikidata.label": q} for q in qids},
+    )
+
+    df = enrich_pipeline.process_wikidata(
+        input_csv=input_csv,
+        output_csv=tmp_path / "Provider_Wikidata.csv",
+        cache_path=tmp_path / "wikidata_cache.json",
+        required_cols=["Wikidata_Label"],
+        registry=registry,
+    )
+
+    assert len(writes) == 1
+    assert df["Wikidata_Label"].tolist() == [f"Q{i}" for i in range(1, n + 1)]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def test_rawg_enrich_searches_each_name_once(tmp_path: Path, monkeypatch):
+    from game_catalog_builder.metrics.registry import load_metrics_registry
+    from game_catalog_builder.pipelines.enrich_pipeline import process_rawg
+    from game_catalog_builder.utils.utilities import write_csv
+
+    input_csv = tmp_path / "Games_User.csv"
+    write_csv(
+        pd.DataFrame(
+            [
+                {"RowId": "rid:1", "Name": "Doom"},
+                {"RowId": "rid:2", "Name": "Doom"},
+                {"RowId": "rid:3", "Name": "Quake"},
+            ]
+        ),
+        input_csv,
+    )
+    (tmp_path / "metrics.yaml").write_text(
+        "version: 2\nmetrics:\n  rawg.id: { column: RAWG_ID, type: string }\n",
+        encoding="utf-8",
+    )
+    registry = load_metrics_registry(tmp_path / "metrics.yaml")
+
+    calls: list[str] = []
+
+    def fake_search(_self, name, year_hint=None):
+        calls.append(name)
+        return {"id": 1 if name == "Doom" else 2, "name": name}
+
+    monkeypatch.setattr("game_catalog_builder.clients.rawg_client.RAWGClient.search", fake_search)
+
+    df = process_rawg(
+        input_csv=input_csv,
+        output_csv=None,
+        cache_path=tmp_path / "rawg_cache.json",
+        credentials={"rawg": {"api_key": "x"}},
+        required_cols=["RAWG_ID"],
+        registry=registry,
+    )
+
+    assert calls == ["Doom", "Quake"]
+    assert df["RAWG_ID"].tolist() == ["1", "1", "2"]
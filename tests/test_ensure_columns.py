@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+def test_ensure_columns_on_empty_frame_keeps_string_dtype():
+    from game_catalog_builder.utils.utilities import ensure_columns
+
+    df = ensure_columns(pd.DataFrame({"Name": pd.Series([], dtype=object)}), {"X": "", "N": 0})
+
+    assert df["X"].dtype == object
+    assert df["X"].str.strip().tolist() == []
+    assert df["N"].dtype == "int64"
+
+
+def test_ensure_columns_adds_defaults_and_keeps_existing():
+    from game_catalog_builder.utils.utilities import ensure_columns
+
+    df = ensure_columns(pd.DataFrame({"Name": ["A", "B"], "X": ["x", ""]}), {"X": "", "Y": ""})
+
+    assert df["X"].tolist() == ["x", ""]
+    assert df["Y"].tolist() == ["", ""]
+    assert df["Y"].dtype == object
@@ -17,3 +17,24 @@ def test_fuzzy_score_allows_goty_expansion_tokens():
     from game_catalog_builder.utils.utilities import fuzzy_score
 
     assert fuzzy_score("Borderlands", "Borderlands Game of the Year Enhanced") == 100
+
+
+def test_fuzzy_score_short_circuits_equal_and_empty_names():
+    from game_catalog_builder.utils.utilities import fuzzy_score
+
+    assert fuzzy_score("DOOM™", "Doom") == 100
+    assert fuzzy_score("", "Doom") == 0
+
+
+def test_fuzzy_scores_pairwise_matches_fuzzy_score(monkeypatch):
+    from game_catalog_builder.utils import utilities
+    from game_catalog_builder.utils.utilities import fuzzy_score, fuzzy_scores_pairwise
+
+    left = ["Doom", "Borderlands", "60 Seconds!", "Doom", ""]
+    right = ["Doom (2016)", "Borderlands GOTY", "60 Seconds Santa Run", "", "Doom"]
+    expected = [fuzzy_score(a, b) for a, b in zip(left, right)]
+
+    assert fuzzy_scores_pairwise(left, right) == expected
+    # Older rapidfuzz releases have no cpdist; the per-pair fallback must agree.
+    monkeypatch.delattr(utilities.process, "cpdist", raising=False)
+    assert fuzzy_scores_pairwise(left, right) == expected
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+def test_iter_named_rows_yields_positions_and_skips():
+    from game_catalog_builder.pipelines.common import iter_named_rows_with_progress
+
+    df = pd.DataFrame(
+        {
+            "Name": ["A", "", "C", " D ", "E"],
+            "Disabled": ["", "", "YES", "", ""],
+        },
+        index=[10, 11, 12, 13, 13],
+    )
+    out = list(
+        iter_named_rows_with_progress(
+            df, label="T", total=None, skip_row=lambda r: r.get("Disabled") == "YES"
+        )
+    )
+    # Duplicate index labels (13) are skipped, as are blank names and skipped rows.
+    assert [(pos, name, seen) for pos, _row, name, seen in out] == [(0, "A", 1)]
+    assert out[0][1] == {"Name": "A", "Disabled": ""}
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import os
+
+
+def test_load_credentials_returns_fresh_copy_and_sees_edits(tmp_path):
+    from game_catalog_builder.utils.utilities import load_credentials
+
+    p = tmp_path / "credentials.yaml"
+    p.write_text("rawg:\n  api_key: one\n", encoding="utf-8")
+
+    first = load_credentials(p)
+    assert first == {"rawg": {"api_key": "one"}}
+    first["rawg"]["api_key"] = "mutated"
+    assert load_credentials(p)["rawg"]["api_key"] == "one"
+
+    p.write_text("rawg:\n  api_key: two-two\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_credentials(p)["rawg"]["api_key"] == "two-two"
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+def test_mask_rows_processed_matches_is_row_processed():
+    from game_catalog_builder.utils.utilities import is_row_processed, mask_rows_processed
+
+    df = pd.DataFrame(
+        {
+            "Name": ["A", "B", "C", "D"],
+            "X_Name": ["a", "", "  ", "d"],
+            "X_ID": ["1", "2", "3", None],
+        }
+    )
+    cols = ["X_Name", "X_ID"]
+    assert mask_rows_processed(df, cols) == [is_row_processed(df, i, cols) for i in range(len(df))]
+    assert mask_rows_processed(df, cols) == [True, False, False, False]
+
+
+def test_mask_rows_processed_missing_column_is_all_false():
+    from game_catalog_builder.utils.utilities import mask_rows_processed
+
+    df = pd.DataFrame({"Name": ["A", "B"]})
+    assert mask_rows_processed(df, ["X_Name"]) == [False, False]
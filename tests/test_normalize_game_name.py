@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+
+def test_normalize_game_name_strips_symbols_and_punctuation():
+    from game_catalog_builder.utils.utilities import normalize_game_name
+
+    assert normalize_game_name("Assassin's Creed®: Director's Cut") == (
+        "assassins creed directors cut"
+    )
+    assert normalize_game_name("DOOM™ (2016)") == "doom 2016"
+
+
+def test_normalize_game_name_converts_each_roman_numeral_token():
+    from game_catalog_builder.utils.utilities import normalize_game_name
+
+    assert normalize_game_name("Final Fantasy VII") == "final fantasy 7"
+    assert normalize_game_name("Rocky I II") == "rocky 1 2"
+    assert normalize_game_name("Vivid Xanadu") == "vivid xanadu"
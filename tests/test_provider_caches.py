@@ -233,3 +233,53 @@ def test_hltb_requires_stable_id(tmp_path, monkeypatch):
 
     data = client.search("Example Game")
     assert data is None
+
+
+def test_save_json_cache_is_atomic_and_skips_unchanged_content(tmp_path):
+    from game_catalog_builder.utils.utilities import load_json_cache, save_json_cache
+
+    p = tmp_path / "cache.json"
+    save_json_cache({"by_id": {"1": {"name": "Doom"}}}, p)
+    assert load_json_cache(p) == {"by_id": {"1": {"name": "Doom"}}}
+    mtime = p.stat().st_mtime_ns
+
+    save_json_cache({"by_id": {"1": {"name": "Doom"}}}, p)
+    assert p.stat().st_mtime_ns == mtime
+    assert [x.name for x in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_save_json_cache_failure_removes_temp_file(tmp_path, monkeypatch):
+    from game_catalog_builder.utils import utilities
+
+    p = tmp_path / "cache.json"
+    utilities.save_json_cache({"by_id": {}}, p)
+
+    def fail_replace(_src, _dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utilities.os, "replace", fail_replace)
+    try:
+        utilities.save_json_cache({"by_id": {"1": {"name": "Doom"}}}, p)
+    except OSError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected OSError")
+
+    assert utilities.load_json_cache(p) == {"by_id": {}}
+    assert [x.name for x in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_save_json_cache_writes_nonfinite_floats_as_null_with_either_encoder(tmp_path, monkeypatch):
+    from game_catalog_builder.utils import utilities
+
+    cache = {"by_id": {"1": {"score": float("nan"), "range": [float("inf"), 1.5]}}}
+    expected = {"by_id": {"1": {"score": None, "range": [None, 1.5]}}}
+
+    utilities.save_json_cache(cache, tmp_path / "default.json")
+    monkeypatch.setattr(utilities, "_orjson", None)
+    utilities.save_json_cache(cache, tmp_path / "stdlib.json")
+
+    for name in ("default.json", "stdlib.json"):
+        raw = (tmp_path / name).read_text(encoding="utf-8")
+        assert "NaN" not in raw and "Infinity" not in raw
+        assert utilities.load_json_cache(tmp_path / name) == expected
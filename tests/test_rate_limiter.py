@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+def test_rate_limiter_spaces_concurrent_callers():
+    from game_catalog_builder.utils.utilities import RateLimiter
+
+    limiter = RateLimiter(min_interval_s=0.02)
+    stamps: list[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(3):
+            limiter.wait()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stamps.sort()
+    assert len(stamps) == 9
+    # Nine calls need at least eight intervals (allow a little scheduler slack).
+    assert stamps[-1] - stamps[0] >= 8 * 0.02 * 0.9
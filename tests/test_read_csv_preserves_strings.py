@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_read_csv_round_trips_cells_verbatim(tmp_path: Path) -> None:
+    from game_catalog_builder.utils.utilities import read_csv
+
+    rows = [
+        ["007", "0.50", "1", "1e5", " 1.50 ", "true", "2016-05-13T00:00:00Z"],
+        ["", "2.25", "3.5", "", "x", "false", ""],
+    ]
+    header = ["Id", "Score", "Float", "Exp", "Padded", "Flag", "Date"]
+    text = "\n".join(",".join(f'"{c}"' for c in r) for r in [header, *rows]) + "\n"
+    path = tmp_path / "in.csv"
+    path.write_text(text, encoding="utf-8")
+
+    df = read_csv(path)
+
+    assert list(df.columns) == header
+    assert df.values.tolist() == rows
@@ -42,3 +42,31 @@ def test_ensure_row_ids_in_input_fixes_duplicates(tmp_path: Path):
     df0 = pd.read_csv(p, dtype=str, keep_default_na=False)
     df, _ = ensure_row_ids(df0)
     assert df["RowId"].nunique() == 2
+
+
+def test_load_identity_overrides_behaves_like_a_mapping(tmp_path: Path):
+    from game_catalog_builder.utils.utilities import load_identity_overrides, write_csv
+
+    p = tmp_path / "catalog.csv"
+    rows = [
+        {"RowId": " rid:a ", "IGDB_ID": " 7 "},
+        {"RowId": "", "IGDB_ID": "8"},
+        {"RowId": "rid:a", "IGDB_ID": "9"},
+    ]
+    write_csv(pd.DataFrame(rows), p)
+
+    overrides = load_identity_overrides(p)
+    assert list(overrides) == ["rid:a"]
+    assert overrides["rid:a"]["IGDB_ID"] == "9"
+    assert overrides["rid:a"]["HLTB_Query"] == ""
+    assert overrides.get("rid:missing", {}) == {}
+    assert not load_identity_overrides(tmp_path / "missing.csv")
+
+
+def test_ensure_row_ids_returns_input_when_ids_are_complete():
+    from game_catalog_builder.utils.utilities import ensure_row_ids
+
+    df = pd.DataFrame([{"RowId": "rid:a", "Name": "A"}, {"RowId": "rid:b", "Name": "B"}])
+    out, created = ensure_row_ids(df)
+    assert out is df
+    assert created == 0
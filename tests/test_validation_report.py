@@ -76,3 +76,41 @@ def test_generate_validation_report_flags_mismatches():
     assert bad["SuggestedCanonicalSource"] in ("Steam", "RAWG", "IGDB", "HLTB")
     assert bad["ReviewTitle"] == "YES"
     assert bad["ReviewTitleReason"] != ""
+
+
+def test_generate_validation_metrics_parallel_matches_serial():
+    from game_catalog_builder.utils.validation import generate_validation_metrics
+
+    df = pd.DataFrame(
+        [
+            {"Name": "Doom", "RAWG_Name": "DOOM", "RAWG_Year": "2016", "IGDB_Name": "Doom 3"},
+            {"Name": "Portal", "Steam_Name": "Portal", "Steam_Platforms": ["Windows"]},
+            {"Name": "Half-Life", "HLTB_Name": "Half-Life 2", "IGDB_Year": "1998"},
+        ]
+        * 3
+    )
+
+    serial = generate_validation_metrics(df, max_workers=1)
+    assert generate_validation_metrics(df, max_workers=2) == serial
+
+
+def test_validation_pool_is_opt_in():
+    from game_catalog_builder.config import VALIDATION
+    from game_catalog_builder.utils.validation import _validation_workers
+
+    # Serial unless VALIDATION.parallel_workers enables the pool or a caller passes max_workers.
+    assert _validation_workers(VALIDATION.parallel_min_rows * 10, None) == 1
+    assert _validation_workers(10, 4) == 4
+
+
+def test_validation_workers_cli_option(monkeypatch):
+    from game_catalog_builder import cli
+    from game_catalog_builder.utils.validation import _validation_workers
+
+    seen = []
+    monkeypatch.setattr(cli, "_command_validate", lambda args: seen.append(args.validation_workers))
+    cli.main(["validate", "--validation-workers", "4"])
+    cli.main(["validate"])
+    assert seen == [4, None]
+    # 0 asks for one worker per CPU (bounded by the row count).
+    assert _validation_workers(1, 0) == 1
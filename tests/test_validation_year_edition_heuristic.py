@@ -36,3 +36,17 @@ def test_validation_steam_year_is_downweighted_for_editions():
     assert row["SteamYearDiffVsPrimary"] == "19"
     # RAWG/IGDB agree; year mismatch tag should be absent.
     assert "year_disagree_rawg_igdb" not in row["ValidationTags"]
+
+
+def test_as_year_ints_accepts_unicode_digits():
+    from game_catalog_builder.utils.validation import _as_year_ints
+
+    assert _as_year_ints([" 2004 ", "２０１６", "1899", "2101", "²⁰¹⁶", "", "20x4"]) == [
+        2004,
+        2016,
+        None,
+        None,
+        None,
+        None,
+        None,
+    ]
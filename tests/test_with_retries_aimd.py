@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+
+def test_with_retries_backs_off_ratelimiter_on_429_and_recovers(monkeypatch):
+    import requests
+
+    from game_catalog_builder.config import RETRY
+    from game_catalog_builder.utils.utilities import RateLimiter, with_retries
+
+    class Resp:
+        status_code = 429
+        headers = {"Retry-After": "0"}
+
+    monkeypatch.setattr("time.sleep", lambda _s: None)
+    limiter = RateLimiter(min_interval_s=0.5)
+
+    calls = {"n": 0}
+
+    def fn():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            e = requests.exceptions.HTTPError("429")
+            e.response = Resp()
+            raise e
+        return "ok"
+
+    stats: dict[str, int] = {}
+    out = with_retries(
+        fn,
+        retries=2,
+        base_sleep_s=0.0,
+        jitter_s=0.0,
+        retry_on=(requests.exceptions.HTTPError,),
+        retry_stats=stats,
+        ratelimiter=limiter,
+    )
+    assert out == "ok"
+    assert stats["rate_backoffs"] == 1
+    # Doubled on the 429, then one additive step back after the success.
+    assert abs(limiter.min_interval_s - (1.0 - RETRY.aimd_recover_step_s)) < 1e-9
+
+    for _ in range(100):
+        limiter.recover()
+    assert limiter.min_interval_s == 0.5
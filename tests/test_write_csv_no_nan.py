@@ -24,3 +24,71 @@ def test_write_csv_does_not_emit_nan_tokens(tmp_path: Path) -> None:
     for row in rows:
         for cell in row:
             assert cell.strip().casefold() != "nan"
+
+
+def test_write_csv_replaces_target_without_leaving_temp_files(tmp_path: Path) -> None:
+    out = tmp_path / "out.csv"
+    out.write_text("stale\n", encoding="utf-8")
+    write_csv(pd.DataFrame([{"RowId": "rid:1", "Name": "Doom"}]), out)
+
+    assert out.read_text(encoding="utf-8").splitlines() == ["RowId,Name", "rid:1,Doom"]
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_write_csv_failure_keeps_target_and_removes_temp_file(tmp_path: Path, monkeypatch) -> None:
+    from game_catalog_builder.utils import utilities
+
+    out = tmp_path / "out.csv"
+    out.write_text("stale\n", encoding="utf-8")
+
+    def fail_replace(_src, _dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utilities.os, "replace", fail_replace)
+    try:
+        write_csv(pd.DataFrame([{"RowId": "rid:1", "Name": "Doom"}]), out)
+    except OSError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected OSError")
+
+    assert out.read_text(encoding="utf-8") == "stale\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_write_csv_concurrent_writers_use_separate_temp_files(tmp_path: Path) -> None:
+    import threading
+
+    out = tmp_path / "out.csv"
+    frames = [pd.DataFrame([{"RowId": f"rid:{i}", "Name": "x" * 2000}] * 200) for i in range(4)]
+    errors: list[BaseException] = []
+
+    def writer(df: pd.DataFrame) -> None:
+        try:
+            for _ in range(5):
+                write_csv(df, out)
+        except BaseException as e:  # pragma: no cover - surfaced by the assert below
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(df,)) for df in frames]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    rows = list(csv.reader(out.open("r", encoding="utf-8", newline="")))
+    assert len(rows) == 201 and len({r[0] for r in rows[1:]}) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_write_csv_recreates_directory_removed_after_first_write(tmp_path: Path) -> None:
+    import shutil
+
+    out = tmp_path / "run" / "output" / "out.csv"
+    df = pd.DataFrame([{"RowId": "rid:1", "Name": "Doom"}])
+    write_csv(df, out)
+    shutil.rmtree(tmp_path / "run")
+
+    write_csv(df, out)
+    assert out.exists()
@@ -15,3 +15,13 @@ def test_extract_year_hint_ignores_non_year_numbers():
     assert extract_year_hint("007 Legends") is None
     assert extract_year_hint("NBA 2K24") is None
     assert extract_year_hint("") is None
+
+
+def test_is_year_token_accepts_unicode_digits():
+    from game_catalog_builder.utils.utilities import _is_year_token
+
+    assert _is_year_token("2016")
+    assert _is_year_token("２０１６")
+    assert not _is_year_token("2101")
+    assert not _is_year_token("1899")
+    assert not _is_year_token("²⁰¹⁶")